@@ -7,6 +7,7 @@ class AppSignals(QObject):
     market_data_ready = Signal(dict)
     market_rows_updated = Signal(list)
     health_changed = Signal(object)
+    config_changed = Signal(dict)
 
 
 signals = AppSignals()
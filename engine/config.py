@@ -159,6 +159,10 @@ class ConfigManager:
             'risk': {
                 'caerleon_high_risk': True
             },
+            'flips': {
+                'workers': 1,
+                'parallel_min_items': 500
+            },
             'crafting': {
                 'resource_return_rate': 0.15,
                 'use_focus': False,
@@ -39,6 +39,15 @@ class FeeCalculator:
         
         return self.sales_tax_premium if premium else self.sales_tax_no_premium
     
+    def as_rates(self, premium: bool = None) -> Tuple[float, float]:
+        """
+        Get the fee rates used by the flip strategies.
+        
+        Returns:
+            (setup_fee, sales_tax) for the given premium status
+        """
+        return self.setup_fee, self.get_sales_tax(premium)
+    
     def calculate_instant_buy_cost(self, market_price: float) -> FeeCalculation:
         """
         Calculate cost for instant buy (buy into sell orders).
@@ -4,16 +4,30 @@ Flip strategy calculator for Albion Trade Optimizer.
 Calculates profitable flip opportunities between cities with risk assessment.
 """
 
+import itertools
 import logging
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass, field
+
+import numpy as np
 
 from .fees import FeeCalculator
 
+# Ordinal for each risk label, lowest first; unknown labels rank above 'high'
+RISK_RANK = {'low': 0, 'medium': 1, 'high': 2}
+_UNKNOWN_RISK_RANK = len(RISK_RANK)
 
-@dataclass
+
+@dataclass(slots=True)
 class FlipOpportunity:
-    """Represents a flip opportunity between cities."""
+    """Represents a flip opportunity between cities.
+    
+    Slotted: bulk passes create and read many of these, so no per-instance dict.
+    """
     item_id: str
     quality: int
     src_city: str
@@ -28,6 +42,10 @@ class FlipOpportunity:
     buy_fees: float
     sell_fees: float
     last_update_age_hours: float
+    risk_rank: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.risk_rank = RISK_RANK.get(self.risk, _UNKNOWN_RISK_RANK)
     
     @property
     def risk_level(self) -> str:
@@ -57,6 +75,122 @@ class FlipOpportunity:
         return self.buy_price + self.buy_fees
 
 
+@dataclass
+class OpportunityBatch:
+    """Column-oriented view of flip opportunities.
+    
+    Bulk passes (filtering, ranking, portfolio selection) read the numeric
+    columns as contiguous arrays; ``to_list`` hands back the row objects.
+    """
+    opportunities: List[FlipOpportunity] = field(repr=False)
+    item_id: np.ndarray
+    quality: np.ndarray
+    src_city: np.ndarray
+    dst_city: np.ndarray
+    risk: np.ndarray
+    risk_rank: np.ndarray
+    profit: np.ndarray
+    buy_price: np.ndarray
+    suggested_qty: np.ndarray
+    expected_profit: np.ndarray
+    age_hours: np.ndarray
+    
+    @classmethod
+    def from_opportunities(cls, opportunities: Sequence[FlipOpportunity]) -> 'OpportunityBatch':
+        """Build the column arrays from a sequence of opportunities."""
+        opps = list(opportunities)
+        n = len(opps)
+        
+        def floats(attr: str) -> np.ndarray:
+            return np.fromiter((getattr(o, attr) for o in opps), dtype=np.float64, count=n)
+        
+        def labels(attr: str) -> np.ndarray:
+            return np.array([getattr(o, attr) for o in opps], dtype=object)
+        
+        return cls(
+            opportunities=opps,
+            item_id=labels('item_id'),
+            quality=np.fromiter((o.quality for o in opps), dtype=np.int32, count=n),
+            src_city=labels('src_city'),
+            dst_city=labels('dst_city'),
+            risk=labels('risk'),
+            risk_rank=np.fromiter((o.risk_rank for o in opps), dtype=np.int8, count=n),
+            profit=floats('profit_per_unit'),
+            buy_price=floats('buy_price'),
+            suggested_qty=np.fromiter((o.suggested_qty for o in opps), dtype=np.int64, count=n),
+            expected_profit=floats('expected_profit'),
+            age_hours=floats('last_update_age_hours'),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.opportunities)
+    
+    def take(self, indices: np.ndarray) -> 'OpportunityBatch':
+        """Return a new batch holding only ``indices`` (index array or boolean mask)."""
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            indices = np.flatnonzero(indices)
+        return OpportunityBatch(
+            opportunities=[self.opportunities[i] for i in indices],
+            item_id=self.item_id[indices],
+            quality=self.quality[indices],
+            src_city=self.src_city[indices],
+            dst_city=self.dst_city[indices],
+            risk=self.risk[indices],
+            risk_rank=self.risk_rank[indices],
+            profit=self.profit[indices],
+            buy_price=self.buy_price[indices],
+            suggested_qty=self.suggested_qty[indices],
+            expected_profit=self.expected_profit[indices],
+            age_hours=self.age_hours[indices],
+        )
+    
+    def to_list(self) -> List[FlipOpportunity]:
+        """Return the opportunities as ``FlipOpportunity`` objects."""
+        return list(self.opportunities)
+
+
+OpportunitySet = Union[Sequence[FlipOpportunity], OpportunityBatch]
+
+
+def _as_batch(opportunities: OpportunitySet) -> OpportunityBatch:
+    if isinstance(opportunities, OpportunityBatch):
+        return opportunities
+    return OpportunityBatch.from_opportunities(opportunities)
+
+
+def _strategy_profits(src_sell: np.ndarray, src_buy: np.ndarray,
+                      dst_sell: np.ndarray, dst_buy: np.ndarray,
+                      setup_fee: float, sales_tax: float) -> Dict[str, Tuple[np.ndarray, ...]]:
+    """
+    Vectorized profit for both strategies over every (src, dst) city pair.
+    
+    Mirrors FeeCalculator.calculate_flip_profit: row index is the source city,
+    column index the destination. Per-city buy/sell terms are returned as 1-D
+    arrays (source-indexed buy side, destination-indexed sell side) alongside
+    the (S, D) profit matrix.
+    
+    Returns:
+        {'fast'|'patient': (profit, buy_price, buy_fees, sell_price, sell_fees)}
+    """
+    # Strategy A (Fast): Instant Buy at source, Instant Sell at destination
+    fast_buy_fees = np.zeros_like(src_sell)
+    fast_sell_fees = dst_buy * sales_tax
+    fast_profit = (dst_buy - fast_sell_fees)[None, :] - (src_sell + fast_buy_fees)[:, None]
+    
+    # Strategy B (Patient): Buy Order at source, Sell Order at destination
+    patient_buy_fees = src_buy * setup_fee
+    patient_sell_fees = dst_sell * sales_tax + dst_sell * setup_fee
+    patient_profit = (dst_sell - patient_sell_fees)[None, :] - (src_buy + patient_buy_fees)[:, None]
+    # A buy order needs a source bid and a sell order needs a destination ask
+    patient_profit[~((src_buy > 0)[:, None] & (dst_sell > 0)[None, :])] = 0.0
+    
+    return {
+        'fast': (fast_profit, src_sell, fast_buy_fees, dst_buy, fast_sell_fees),
+        'patient': (patient_profit, src_buy, patient_buy_fees, dst_sell, patient_sell_fees),
+    }
+
+
 class RiskClassifier:
     """Classifies trading routes by risk level."""
     
@@ -92,10 +226,18 @@ class FlipCalculator:
         
         self.fee_calculator = FeeCalculator(config)
         self.risk_classifier = RiskClassifier(config)
+        self.fee_rates = tuple(np.float64(rate) for rate in self.fee_calculator.as_rates())
         
         # Configuration values
         self.cities = config.get('cities', [])
         self.max_age_hours = config.get('freshness', {}).get('max_age_hours', 24)
+        
+        # Items are independent, so large batches can be spread over processes.
+        # workers=0 means one per CPU; 1 keeps everything in-process.
+        flips_config = config.get('flips', {})
+        workers = int(flips_config.get('workers', 1))
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.parallel_min_items = int(flips_config.get('parallel_min_items', 500))
     
     def calculate_flip_opportunities(self, prices_by_item: Dict[str, List[Dict[str, Any]]], 
                                    activity_scores: Optional[Dict[str, Dict[str, Any]]] = None) -> List[FlipOpportunity]:
@@ -109,100 +251,127 @@ class FlipCalculator:
         Returns:
             List of flip opportunities sorted by profit
         """
-        opportunities = []
-        
-        for item_id, price_records in prices_by_item.items():
-            # Group prices by city and quality
-            prices_by_city = {}
-            for price in price_records:
-                key = (price['city'], price['quality'])
-                if key not in prices_by_city:
-                    prices_by_city[key] = price
-                else:
-                    # Keep the most recent price
-                    if price['observed_at_utc'] > prices_by_city[key]['observed_at_utc']:
-                        prices_by_city[key] = price
-            
-            # Calculate opportunities for each quality level
-            qualities = set(key[1] for key in prices_by_city.keys())
-            
-            for quality in qualities:
-                quality_prices = {city: price for (city, q), price in prices_by_city.items() if q == quality}
-                
-                # Calculate flips between all city pairs
-                city_pairs = [(src, dst) for src in quality_prices.keys() for dst in quality_prices.keys() if src != dst]
-                
-                for src_city, dst_city in city_pairs:
-                    src_price = quality_prices[src_city]
-                    dst_price = quality_prices[dst_city]
-                    
-                    # Calculate both strategies
-                    flip_results = self._calculate_city_pair_flips(
-                        item_id, quality, src_city, dst_city, src_price, dst_price, activity_scores
-                    )
-                    
-                    opportunities.extend(flip_results)
+        if self._use_process_pool(len(prices_by_item)):
+            opportunities = self._calculate_in_process_pool(prices_by_item, activity_scores)
+        else:
+            opportunities = []
+            process_item = self._process_item
+            extend = opportunities.extend
+            for item_id, price_records in prices_by_item.items():
+                extend(process_item(item_id, price_records, activity_scores))
         
         # Sort by profit descending
         opportunities.sort(key=lambda x: x.profit_per_unit, reverse=True)
         
         return opportunities
     
-    def _calculate_city_pair_flips(self, item_id: str, quality: int, src_city: str, dst_city: str,
-                                  src_price: Dict[str, Any], dst_price: Dict[str, Any],
-                                  activity_scores: Optional[Dict[str, Dict[str, Any]]] = None) -> List[FlipOpportunity]:
-        """Calculate flip opportunities for a specific city pair."""
-        opportunities = []
+    def _use_process_pool(self, item_count: int) -> bool:
+        """Only fan out when the batch is large enough to amortize worker startup."""
+        return self.workers > 1 and item_count >= self.parallel_min_items
+    
+    def _calculate_in_process_pool(self, prices_by_item: Dict[str, List[Dict[str, Any]]],
+                                   activity_scores: Optional[Dict[str, Dict[str, Any]]] = None) -> List[FlipOpportunity]:
+        """Compute items in worker processes; results keep the input item order."""
+        item_ids = list(prices_by_item.keys())
+        records = [prices_by_item[item_id] for item_id in item_ids]
+        chunksize = max(1, len(item_ids) // (self.workers * 4))
         
-        # Prepare price data for fee calculator
-        src_prices = {
-            'sell_price_min': src_price.get('sell_price_min'),
-            'buy_price_max': src_price.get('buy_price_max')
-        }
+        opportunities = []
+        with ProcessPoolExecutor(max_workers=self.workers,
+                                 initializer=_init_flip_worker,
+                                 initargs=(self.config,)) as pool:
+            for item_opportunities in pool.map(_process_item_in_worker, item_ids, records,
+                                               itertools.repeat(activity_scores), chunksize=chunksize):
+                opportunities.extend(item_opportunities)
         
-        dst_prices = {
-            'sell_price_min': dst_price.get('sell_price_min'),
-            'buy_price_max': dst_price.get('buy_price_max')
-        }
+        return opportunities
+    
+    def _process_item(self, item_id: str, price_records: List[Dict[str, Any]],
+                      activity_scores: Optional[Dict[str, Dict[str, Any]]] = None) -> List[FlipOpportunity]:
+        """Calculate flip opportunities for a single item across all city pairs."""
+        opportunities = []
         
-        # Skip if essential prices are missing
-        if not all([src_prices['sell_price_min'], dst_prices['buy_price_max']]):
-            return opportunities
+        # Bind hot lookups once; runs once per quality level of every item
+        quality_flips = self._calculate_quality_flips
+        extend = opportunities.extend
         
-        # Calculate both strategies
-        strategies = self.fee_calculator.calculate_both_strategies(src_prices, dst_prices)
+        # Group prices by quality, then city, in a single pass
+        prices_by_quality = defaultdict(dict)
+        for price in price_records:
+            quality_prices = prices_by_quality[price['quality']]
+            current = quality_prices.get(price['city'])
+            # Keep the most recent price
+            if current is None or price['observed_at_utc'] > current['observed_at_utc']:
+                quality_prices[price['city']] = price
         
-        # Classify route risk
-        risk = self.risk_classifier.classify_route_risk(src_city, dst_city)
+        # Calculate opportunities for each quality level
+        for quality, quality_prices in prices_by_quality.items():
+            extend(quality_flips(item_id, quality, quality_prices, activity_scores))
         
-        # Get activity score for quantity suggestion
-        suggested_qty = self._get_suggested_quantity(item_id, src_city, dst_city, activity_scores)
+        return opportunities
+    
+    def _calculate_quality_flips(self, item_id: str, quality: int, quality_prices: Dict[str, Dict[str, Any]],
+                                 activity_scores: Optional[Dict[str, Dict[str, Any]]] = None) -> List[FlipOpportunity]:
+        """Calculate flip opportunities between every city pair of one item quality."""
+        opportunities = []
+        cities = list(quality_prices)
+        if len(cities) < 2:
+            return opportunities
         
-        # Calculate age of price data
-        src_age = self._calculate_age_hours(src_price['observed_at_utc'])
-        dst_age = self._calculate_age_hours(dst_price['observed_at_utc'])
-        max_age = max(src_age, dst_age)
+        sell_min = np.array([quality_prices[c].get('sell_price_min') or 0 for c in cities], dtype=np.float64)
+        buy_max = np.array([quality_prices[c].get('buy_price_max') or 0 for c in cities], dtype=np.float64)
+        
+        # Only cities with an ask can be sources and only cities with a bid can be
+        # destinations; drop the rest once instead of checking every pair
+        src_idx = np.flatnonzero(np.isfinite(sell_min) & (sell_min > 0))
+        dst_idx = np.flatnonzero(np.isfinite(buy_max) & (buy_max > 0))
+        if len(src_idx) < len(cities) or len(dst_idx) < len(cities):
+            self.logger.debug(
+                "%s q%s: dropped %d source and %d destination cities with missing prices",
+                item_id, quality, len(cities) - len(src_idx), len(cities) - len(dst_idx)
+            )
+        if not len(src_idx) or not len(dst_idx):
+            return opportunities
         
-        # Create opportunities for both strategies
-        for strategy_name, strategy_data in strategies.items():
-            if strategy_data['profit_per_unit'] > 0:  # Only profitable flips
-                opportunity = FlipOpportunity(
+        profits = _strategy_profits(sell_min[src_idx], np.nan_to_num(buy_max[src_idx]),
+                                    np.nan_to_num(sell_min[dst_idx]), buy_max[dst_idx],
+                                    *self.fee_rates)
+        pair_mask = src_idx[:, None] != dst_idx[None, :]
+        
+        classify_risk = self.risk_classifier.classify_route_risk
+        suggested_quantity = self._get_suggested_quantity
+        age_hours = self._calculate_age_hours
+        ages = [age_hours(quality_prices[c]['observed_at_utc']) for c in cities]
+        append = opportunities.append
+        
+        for i, j in np.argwhere(pair_mask).tolist():
+            src, dst = int(src_idx[i]), int(dst_idx[j])
+            src_city, dst_city = cities[src], cities[dst]
+            risk = None
+            for strategy_name, (profit, buy_price, buy_fees, sell_price, sell_fees) in profits.items():
+                profit_per_unit = float(profit[i, j])
+                if not profit_per_unit > 0:  # Only profitable flips
+                    continue
+                if risk is None:
+                    risk = classify_risk(src_city, dst_city)
+                    suggested_qty = suggested_quantity(item_id, src_city, dst_city, activity_scores)
+                    max_age = max(ages[src], ages[dst])
+                append(FlipOpportunity(
                     item_id=item_id,
                     quality=quality,
                     src_city=src_city,
                     dst_city=dst_city,
                     strategy=strategy_name,
-                    profit_per_unit=strategy_data['profit_per_unit'],
+                    profit_per_unit=profit_per_unit,
                     suggested_qty=suggested_qty,
-                    expected_profit=strategy_data['profit_per_unit'] * suggested_qty,
+                    expected_profit=profit_per_unit * suggested_qty,
                     risk=risk,
-                    buy_price=strategy_data['buy_price'],
-                    sell_price=strategy_data['sell_price'],
-                    buy_fees=strategy_data['buy_fees'],
-                    sell_fees=strategy_data['sell_fees'],
+                    buy_price=float(buy_price[i]),
+                    sell_price=float(sell_price[j]),
+                    buy_fees=float(buy_fees[i]),
+                    sell_fees=float(sell_fees[j]),
                     last_update_age_hours=max_age
-                )
-                opportunities.append(opportunity)
+                ))
         
         return opportunities
     
@@ -226,100 +395,125 @@ class FlipCalculator:
     
     def _calculate_age_hours(self, observed_at_utc) -> float:
         """Calculate age of price data in hours."""
-        from datetime import datetime
-        
         if isinstance(observed_at_utc, str):
             # Parse string timestamp if needed
-            from datetime import datetime
             observed_at_utc = datetime.fromisoformat(observed_at_utc.replace('Z', '+00:00'))
         
-        age = datetime.utcnow() - observed_at_utc
+        # Naive timestamps are stored as UTC
+        if observed_at_utc.tzinfo is None:
+            observed_at_utc = observed_at_utc.replace(tzinfo=timezone.utc)
+        
+        age = datetime.now(timezone.utc) - observed_at_utc
         return age.total_seconds() / 3600
     
-    def filter_opportunities(self, opportunities: List[FlipOpportunity],
+    def filter_opportunities(self, opportunities: OpportunitySet,
                            min_profit: float = 0,
                            max_age_hours: Optional[float] = None,
                            risk_filter: Optional[str] = None,
-                           cities_filter: Optional[List[str]] = None) -> List[FlipOpportunity]:
+                           cities_filter: Optional[List[str]] = None,
+                           max_risk: Optional[str] = None) -> List[FlipOpportunity]:
         """
         Filter flip opportunities based on criteria.
         
         Args:
-            opportunities: List of flip opportunities
+            opportunities: List or batch of flip opportunities
             min_profit: Minimum profit per unit
             max_age_hours: Maximum age of price data in hours
             risk_filter: 'low', 'high', or None for all
             cities_filter: List of cities to include (both src and dst)
+            max_risk: Highest risk level to keep ('low' < 'medium' < 'high')
         
         Returns:
             Filtered list of opportunities
         """
-        filtered = opportunities
+        batch = _as_batch(opportunities)
+        mask = np.ones(len(batch), dtype=bool)
         
         # Filter by minimum profit
         if min_profit > 0:
-            filtered = [opp for opp in filtered if opp.profit_per_unit >= min_profit]
+            mask &= batch.profit >= min_profit
         
         # Filter by age
         if max_age_hours is not None:
-            filtered = [opp for opp in filtered if opp.last_update_age_hours <= max_age_hours]
+            mask &= batch.age_hours <= max_age_hours
         
         # Filter by risk
         if risk_filter:
-            filtered = [opp for opp in filtered if opp.risk == risk_filter]
+            mask &= batch.risk == risk_filter
+        if max_risk:
+            mask &= batch.risk_rank <= RISK_RANK[max_risk]
         
         # Filter by cities
         if cities_filter:
-            filtered = [opp for opp in filtered 
-                       if opp.src_city in cities_filter and opp.dst_city in cities_filter]
+            allowed = list(cities_filter)
+            mask &= np.isin(batch.src_city, allowed) & np.isin(batch.dst_city, allowed)
         
-        return filtered
+        return batch.take(mask).to_list()
     
-    def get_best_opportunities_by_item(self, opportunities: List[FlipOpportunity]) -> Dict[str, FlipOpportunity]:
+    def get_best_opportunities_by_item(self, opportunities: OpportunitySet) -> Dict[str, FlipOpportunity]:
         """
         Get the best opportunity for each item (highest profit per unit).
         
         Returns:
             Dictionary mapping item_id to best opportunity
         """
-        best_by_item = {}
+        batch = _as_batch(opportunities)
+        if not len(batch):
+            return {}
         
-        for opp in opportunities:
-            key = f"{opp.item_id}_q{opp.quality}"
-            if key not in best_by_item or opp.profit_per_unit > best_by_item[key].profit_per_unit:
-                best_by_item[key] = opp
+        _, item_codes = np.unique(batch.item_id.astype(str), return_inverse=True)
+        quality = batch.quality.astype(np.int64)
+        
+        # One integer key per (item, quality); lexsort is stable so ties keep
+        # the first opportunity seen, matching the previous strict ">" check.
+        key = item_codes.astype(np.int64) * (int(quality.max()) + 1) + quality
+        order = np.lexsort((-batch.profit, key))
+        _, first_idx = np.unique(key[order], return_index=True)
+        
+        best_by_item = {}
+        for opp in batch.take(order[first_idx]).to_list():
+            best_by_item[f"{opp.item_id}_q{opp.quality}"] = opp
         
         return best_by_item
     
-    def calculate_portfolio_profit(self, opportunities: List[FlipOpportunity], 
+    def calculate_portfolio_profit(self, opportunities: OpportunitySet, 
                                  capital_limit: Optional[float] = None) -> Dict[str, Any]:
         """
         Calculate total profit for a portfolio of opportunities.
         
         Args:
-            opportunities: List of selected opportunities
+            opportunities: List or batch of selected opportunities
             capital_limit: Maximum capital to invest
         
         Returns:
             Portfolio analysis
         """
-        total_investment = 0
-        total_profit = 0
-        selected_opportunities = []
-        
-        # Sort by profit per unit descending
-        sorted_opps = sorted(opportunities, key=lambda x: x.profit_per_unit, reverse=True)
-        
-        for opp in sorted_opps:
-            investment_needed = opp.buy_price * opp.suggested_qty
-            
-            if capital_limit is None or total_investment + investment_needed <= capital_limit:
-                total_investment += investment_needed
-                total_profit += opp.expected_profit
-                selected_opportunities.append(opp)
-            
-            if capital_limit and total_investment >= capital_limit:
-                break
+        batch = _as_batch(opportunities)
+        
+        # Sort by profit per unit descending (stable, like sorted(reverse=True))
+        order = np.argsort(-batch.profit, kind='stable')
+        investments = (batch.buy_price * batch.suggested_qty)[order]
+        profits = batch.expected_profit[order]
+        
+        if capital_limit is None:
+            selected = order
+            total_investment = float(investments.sum())
+            total_profit = float(profits.sum())
+        else:
+            picked = []
+            total_investment = 0
+            total_profit = 0
+            for pos, (investment_needed, profit) in enumerate(zip(investments.tolist(), profits.tolist())):
+                if total_investment + investment_needed <= capital_limit:
+                    total_investment += investment_needed
+                    total_profit += profit
+                    picked.append(pos)
+                
+                if capital_limit and total_investment >= capital_limit:
+                    break
+            selected = order[np.asarray(picked, dtype=np.intp)]
+        
+        selected_opportunities = batch.take(selected).to_list()
         
         return {
             'total_investment': total_investment,
@@ -329,3 +523,17 @@ class FlipCalculator:
             'selected_opportunities': selected_opportunities
         }
 
+
+# Per-process calculator used by the ProcessPoolExecutor path; built once in
+# each worker by the pool initializer instead of being pickled per item.
+_worker_calculator: Optional[FlipCalculator] = None
+
+
+def _init_flip_worker(config: Dict[str, Any]) -> None:
+    global _worker_calculator
+    _worker_calculator = FlipCalculator(config)
+
+
+def _process_item_in_worker(item_id: str, price_records: List[Dict[str, Any]],
+                            activity_scores: Optional[Dict[str, Dict[str, Any]]] = None) -> List[FlipOpportunity]:
+    return _worker_calculator._process_item(item_id, price_records, activity_scores)
@@ -5,10 +5,11 @@ Provides the primary user interface for the application.
 """
 
 import sys
+import atexit
 import logging
 import os
-import webbrowser
 import subprocess
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -17,30 +18,36 @@ from PySide6.QtWidgets import (
     QTabWidget, QMenuBar, QStatusBar, QToolBar, QSplitter,
     QLabel, QPushButton, QProgressBar, QMessageBox, QSystemTrayIcon
 )
-from PySide6.QtCore import Qt, QTimer, QThread, Signal, QSettings
+from PySide6.QtCore import Qt, QTimer, QThread, QThreadPool, Signal, QSettings
 from PySide6.QtGui import QAction, QIcon, QPixmap
 
-# Import custom widgets
+# Import custom widgets; the other tabs are imported when first opened
 from gui.widgets.dashboard import DashboardWidget
-from gui.widgets.flip_finder import FlipFinderWidget
-from gui.widgets.crafting_optimizer import CraftingOptimizerWidget
-from gui.widgets.settings import SettingsWidget
-from gui.widgets.data_manager import DataManagerWidget
 from gui.widgets.market_prices import MarketPricesWidget
-from gui.widgets.items_browser import ItemsBrowser
 
 # Import backend components
 from engine.config import ConfigManager
 from datasources.aodp import AODPClient
 from store.db import DatabaseManager
-from services.albion_client import (
-    find_client,
-    launch_client_with_fallback,
-    capture_subproc_version,
-)
 from core.signals import signals
+from gui.threads import BackendInitWorker, ProcessWatcher, WorkerRunnable
 from core.health import health_store
 from utils.catalog_provider import ensure_master_catalog
+from utils.constants import AODP_CACHE_TTL_SECONDS
+
+
+_TRAY_ICON: Optional[QIcon] = None
+
+
+def _get_tray_icon() -> QIcon:
+    """Return the tray icon, rendering it on first use."""
+    global _TRAY_ICON
+    if _TRAY_ICON is None:
+        # Use a simple colored square for now
+        pixmap = QPixmap(16, 16)
+        pixmap.fill(Qt.blue)
+        _TRAY_ICON = QIcon(pixmap)
+    return _TRAY_ICON
 
 
 class MainWindow(QMainWindow):
@@ -51,14 +58,33 @@ class MainWindow(QMainWindow):
         self.logger = logging.getLogger(__name__)
         self.config_manager = ConfigManager()
         self.config = config or self.config_manager.load_config()
+        self._client_flags = self._read_client_flags(self.config)
         self.db_manager = db_manager or DatabaseManager(self.config)
         self.api_client = None
         self.settings = QSettings('AlbionTradeOptimizer', 'AlbionTradeOptimizer')
+        # Read persisted window state once; written back only when it changes
+        self._settings_cache = {
+            "geometry": self.settings.value("geometry"),
+            "windowState": self.settings.value("windowState"),
+            # INI backends return strings; keep an int so unchanged tabs compare equal
+            "currentTab": self.settings.value("currentTab", 0, type=int),
+        }
         self.albion_proc: Optional[subprocess.Popen] = None
+        # closeEvent is skipped on crashes and kills; make sure the client dies with us
+        atexit.register(self._kill_client)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._kill_client)
+        # Coalesce bursts of refresh requests (F5, toolbar, auto-timer)
+        self._refresh_debounce = QTimer(self)
+        self._refresh_debounce.setSingleShot(True)
+        self._refresh_debounce.setInterval(300)
+        self._refresh_debounce.timeout.connect(self._run_scheduled_refresh)
         self.init_ui(); self.init_menu_bar(); self.init_tool_bar()
         self.init_status_bar(); self.init_system_tray()
         self.init_backend(); self.restore_window_state(); self.init_timers()
         signals.health_changed.connect(self.on_health_changed)
+        signals.config_changed.connect(self.on_config_changed)
 
     # ------------------------------------------------------------------
     # Qt events
@@ -102,34 +128,102 @@ class MainWindow(QMainWindow):
         self.create_tabs()
     
     def create_tabs(self):
-        """Create and configure all tabs."""
+        """Create and configure all tabs.
+
+        The dashboard (landing tab) and market prices (owner of the refresh
+        worker) are built immediately; the remaining tabs start as empty
+        placeholders and are constructed the first time they are shown.
+        """
+        self._tab_factories: Dict[int, tuple] = {}
+        self._tab_indexes: Dict[str, int] = {}
+
         # Dashboard tab
         self.dashboard_widget = DashboardWidget(self)
         self.tab_widget.addTab(self.dashboard_widget, "📊 Dashboard")
         
         # Flip Finder tab
-        self.flip_finder_widget = FlipFinderWidget(self)
-        self.tab_widget.addTab(self.flip_finder_widget, "💰 Flip Finder")
+        self._add_lazy_tab("flip_finder_widget", self._create_flip_finder, "💰 Flip Finder")
 
         # Crafting Optimizer tab
-        self.crafting_optimizer_widget = CraftingOptimizerWidget(self)
-        self.tab_widget.addTab(self.crafting_optimizer_widget, "🔨 Crafting")
+        self._add_lazy_tab("crafting_optimizer_widget", self._create_crafting_optimizer, "🔨 Crafting")
 
         # Data Manager tab
-        self.data_manager_widget = DataManagerWidget(self)
-        self.tab_widget.addTab(self.data_manager_widget, "📡 Data")
+        self._add_lazy_tab("data_manager_widget", self._create_data_manager, "📡 Data")
 
         # Market Prices tab
         self.market_prices_widget = MarketPricesWidget(self)
         self.tab_widget.addTab(self.market_prices_widget, "💹 Prices")
 
         # Items tab
-        self.items_browser = ItemsBrowser(self)
-        self.tab_widget.addTab(self.items_browser, "📦 Items")
+        self._add_lazy_tab("items_browser", self._create_items_browser, "📦 Items")
 
         # Settings tab
-        self.settings_widget = SettingsWidget(self)
-        self.tab_widget.addTab(self.settings_widget, "⚙️ Settings")
+        self._add_lazy_tab("settings_widget", self._create_settings, "⚙️ Settings")
+
+        self.tab_widget.currentChanged.connect(self._ensure_tab)
+
+    def _add_lazy_tab(self, attr: str, factory, label: str) -> None:
+        """Add a placeholder tab whose real widget is built on first use."""
+        setattr(self, attr, None)
+        index = self.tab_widget.addTab(QWidget(), label)
+        self._tab_factories[index] = (attr, factory)
+        self._tab_indexes[attr] = index
+
+    def _ensure_tab(self, index: int) -> Optional[QWidget]:
+        """Construct the widget for tab ``index`` if it is still a placeholder."""
+        entry = self._tab_factories.pop(index, None)
+        if entry is None:
+            return self.tab_widget.widget(index)
+        attr, factory = entry
+        widget = factory()
+        setattr(self, attr, widget)
+
+        placeholder = self.tab_widget.widget(index)
+        label = self.tab_widget.tabText(index)
+        current = self.tab_widget.currentIndex()
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, widget, label)
+            self.tab_widget.setCurrentIndex(current)
+        finally:
+            self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+        return widget
+
+    def get_tab(self, attr: str) -> QWidget:
+        """Return the tab widget stored under ``attr``, building it if needed."""
+        widget = getattr(self, attr)
+        if widget is None:
+            widget = self._ensure_tab(self._tab_indexes[attr])
+        return widget
+
+    def _create_flip_finder(self) -> QWidget:
+        from gui.widgets.flip_finder import FlipFinderWidget
+        return FlipFinderWidget(self)
+
+    def _create_crafting_optimizer(self) -> QWidget:
+        from gui.widgets.crafting_optimizer import CraftingOptimizerWidget
+        return CraftingOptimizerWidget(self)
+
+    def _create_data_manager(self) -> QWidget:
+        from gui.widgets.data_manager import DataManagerWidget
+        return DataManagerWidget(self)
+
+    def _create_settings(self) -> QWidget:
+        from gui.widgets.settings import SettingsWidget
+        return SettingsWidget(self)
+
+    def _create_items_browser(self) -> QWidget:
+        """Build the items tab and seed it with rows fetched before it existed."""
+        from gui.widgets.items_browser import ItemsBrowser
+        from services.market_prices import STORE
+
+        browser = ItemsBrowser(self)
+        rows = STORE.latest_rows()
+        if rows:
+            browser.on_rows_updated(rows)
+        return browser
     
     def init_menu_bar(self):
         """Initialize the menu bar."""
@@ -206,7 +300,9 @@ class MainWindow(QMainWindow):
         # Settings button
         settings_action = QAction('⚙️ Settings', self)
         settings_action.setToolTip('Open settings')
-        settings_action.triggered.connect(lambda: self.tab_widget.setCurrentWidget(self.settings_widget))
+        settings_action.triggered.connect(
+            lambda: self.tab_widget.setCurrentWidget(self.get_tab('settings_widget'))
+        )
         toolbar.addAction(settings_action)
 
     def init_status_bar(self):
@@ -244,10 +340,7 @@ class MainWindow(QMainWindow):
         if QSystemTrayIcon.isSystemTrayAvailable():
             self.tray_icon = QSystemTrayIcon(self)
             
-            # Create tray icon (use a simple colored square for now)
-            pixmap = QPixmap(16, 16)
-            pixmap.fill(Qt.blue)
-            self.tray_icon.setIcon(QIcon(pixmap))
+            self.tray_icon.setIcon(_get_tray_icon())
             
             self.tray_icon.setToolTip("Albion Trade Optimizer")
             self.tray_icon.show()
@@ -263,29 +356,78 @@ class MainWindow(QMainWindow):
             self.api_client = AODPClient(self.config)
             self.logger.info("API client initialized")
             
-            # Test API connection
-            self.test_api_connection()
-
-            client_path = find_client(
-                self.config.get('albion_client_path'),
-                ask_download=self._prompt_download_client,
-            )
-            if not client_path:
-                self.logger.error("Albion Data Client not found or invalid. Install the 64-bit client under 'C:\\Program Files\\Albion Data Client\\' or set a valid path in Settings.")
-            else:
-                try:
-                    flags = list(self.config.get("client", {}).get("flags", []))
-                    self.albion_proc = launch_client_with_fallback(
-                        client_path, flags
-                    )
-                    capture_subproc_version(client_path)
-                except Exception as e:
-                    self.logger.exception("Failed to initialize backend components: %s", e)
+            # Connection test and client launch can block for seconds;
+            # run them off the GUI thread
+            self.start_backend_worker()
 
         except Exception as e:
             self.logger.error(f"Failed to initialize backend: {e}")
             self.show_error("Backend Initialization Error",
                           f"Failed to initialize backend components:\n{e}")
+
+    def start_backend_worker(self, test_connection: bool = True, download: bool = False):
+        """Test the API and launch the data client on a pool thread."""
+        self._backend_worker = BackendInitWorker(
+            self.api_client if test_connection else None,
+            self.config.get('albion_client_path'),
+            self._client_flags,
+            download=download,
+        )
+        self._backend_worker.connection_status.connect(self.on_connection_status)
+        self._backend_worker.client_ready.connect(self.on_client_ready)
+        self._backend_worker.client_missing.connect(self.on_client_missing)
+        QThreadPool.globalInstance().start(WorkerRunnable(self._backend_worker))
+
+    def on_connection_status(self, text: str, tooltip: str) -> None:
+        """Show the result of the background API connection test."""
+        self.connection_label.setText(text)
+        self.connection_label.setToolTip(tooltip)
+
+    def on_client_ready(self, proc) -> None:
+        """Keep the handle of the data client started by the backend worker."""
+        self._watch_client(proc)
+
+    def _watch_client(self, proc) -> None:
+        """Track ``proc`` as the running data client and notice when it exits."""
+        self.albion_proc = proc
+        self._client_watcher = ProcessWatcher(proc)
+        self._client_watcher.exited.connect(lambda code: self._on_client_exited(proc, code))
+        self._client_watcher.start()
+
+    def _on_client_exited(self, proc, code: int) -> None:
+        self.logger.info("Albion Data Client exited with code %s", code)
+        if self.albion_proc is proc:
+            self.albion_proc = None
+
+    def on_client_missing(self) -> None:
+        """Offer to download the data client when none was found."""
+        if self._backend_worker.download:
+            self._log_client_missing()
+            return
+        # Ask once the event loop is running so the window paints first
+        QTimer.singleShot(0, self._ask_and_retry_client)
+
+    def _ask_and_retry_client(self) -> None:
+        """Show a non-blocking download prompt; retry the launch on Yes."""
+        box = QMessageBox(
+            QMessageBox.Question,
+            "Albion Data Client",
+            "Download the official Windows client now?",
+            QMessageBox.Yes | QMessageBox.No,
+            self,
+        )
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.finished.connect(self._on_download_prompt_finished)
+        box.open()
+
+    def _on_download_prompt_finished(self, result: int) -> None:
+        if result == QMessageBox.Yes:
+            self.start_backend_worker(test_connection=False, download=True)
+        else:
+            self._log_client_missing()
+
+    def _log_client_missing(self) -> None:
+        self.logger.error("Albion Data Client not found or invalid. Install the 64-bit client under 'C:\\Program Files\\Albion Data Client\\' or set a valid path in Settings.")
     
     def init_timers(self):
         """Initialize periodic timers."""
@@ -299,23 +441,6 @@ class MainWindow(QMainWindow):
             self.refresh_timer.start(auto_refresh_minutes * 60 * 1000)
             self.logger.info(f"Auto-refresh enabled: every {auto_refresh_minutes} minutes")
     
-    def test_api_connection(self):
-        """Test API connection and update status."""
-        try:
-            if self.api_client and self.api_client.test_connection():
-                self.connection_label.setText("🟢 Connected")
-                self.connection_label.setToolTip("API connection active")
-                self.logger.info("API connection test successful")
-            else:
-                self.connection_label.setText("🟡 Limited")
-                self.connection_label.setToolTip("API connection issues")
-                self.logger.warning("API connection test failed")
-
-        except Exception as e:
-            self.connection_label.setText("🔴 Disconnected")
-            self.connection_label.setToolTip(f"API connection error: {e}")
-            self.logger.error(f"API connection test error: {e}")
-
     def _prompt_download_client(self) -> bool:
         reply = QMessageBox.question(
             self,
@@ -327,34 +452,65 @@ class MainWindow(QMainWindow):
 
     def on_toggle_uploader(self, enabled: bool):
         if enabled:
+            from services.albion_client import find_client, launch_client_with_fallback
+
             client_path = find_client(
                 self.config.get('albion_client_path'),
                 ask_download=self._prompt_download_client,
             )
             if not client_path:
-                self.logger.error("Albion Data Client not found or invalid. Install the 64-bit client under 'C:\\Program Files\\Albion Data Client\\' or set a valid path in Settings.")
+                self._log_client_missing()
                 return
             try:
-                flags = list(self.config.get("client", {}).get("flags", []))
-                self.albion_proc = launch_client_with_fallback(client_path, flags)
+                self._watch_client(launch_client_with_fallback(client_path, list(self._client_flags)))
             except Exception as e:
                 self.logger.exception("Failed to launch Albion Data Client: %s", e)
         else:
-            if self.albion_proc and self.albion_proc.poll() is None:
-                try:
-                    self.albion_proc.terminate()
-                except Exception:
-                    pass
-                self.albion_proc = None
+            self._kill_client()
+
+    def _kill_client(self) -> None:
+        """Stop the data client if it is still running.
+
+        Also runs on ``aboutToQuit`` and at interpreter exit so the child
+        process does not outlive the GUI.
+        """
+        proc, self.albion_proc = self.albion_proc, None
+        if proc is None or proc.poll() is not None:
+            return
+        try:
+            proc.terminate()
+            try:
+                proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        except Exception:
+            pass
     
     def refresh_data(self):
-        """Refresh market data using the prices widget worker."""
+        """Schedule a market data refresh, coalescing rapid repeated calls."""
         self.set_status("Refreshing market data...")
+        self._refresh_debounce.start()
+
+    def _run_scheduled_refresh(self):
+        """Start the debounced refresh unless one is already in flight."""
+        if self.market_prices_widget.refresh_running:
+            self.logger.info("Refresh already in flight; skipping duplicate request")
+            return
         # Delegate to market prices widget which handles threading
         self.market_prices_widget.on_refresh_clicked()
     
     def auto_refresh_data(self):
-        """Automatically refresh data (called by timer)."""
+        """Automatically refresh data (called by timer).
+
+        Skipped while the last refresh is younger than the AODP proxy cache,
+        e.g. right after a manual F5; manual refreshes are never skipped.
+        """
+        started = self.market_prices_widget.last_refresh_started
+        # Leave slack so regular timer ticks are never treated as fresh
+        fresh_for = min(AODP_CACHE_TTL_SECONDS, 0.9 * self.refresh_timer.interval() / 1000)
+        if started is not None and time.monotonic() - started < fresh_for:
+            self.set_status("Market data still fresh; auto-refresh skipped")
+            return
         self.logger.info("Auto-refreshing data")
         self.refresh_data()
     
@@ -378,14 +534,16 @@ class MainWindow(QMainWindow):
     def export_data(self):
         """Export data to file."""
         # This will be implemented by the data manager widget
-        self.tab_widget.setCurrentWidget(self.data_manager_widget)
-        self.data_manager_widget.export_data()
+        data_manager = self.get_tab('data_manager_widget')
+        self.tab_widget.setCurrentWidget(data_manager)
+        data_manager.export_data()
     
     def import_data(self):
         """Import data from file."""
         # This will be implemented by the data manager widget
-        self.tab_widget.setCurrentWidget(self.data_manager_widget)
-        self.data_manager_widget.import_data()
+        data_manager = self.get_tab('data_manager_widget')
+        self.tab_widget.setCurrentWidget(data_manager)
+        data_manager.import_data()
     
     def show_quick_search(self):
         """Show quick search dialog."""
@@ -435,6 +593,14 @@ class MainWindow(QMainWindow):
         else:
             self.connection_label.setText("🔴 Offline")
     
+    @staticmethod
+    def _read_client_flags(config: Dict[str, Any]) -> tuple:
+        return tuple(config.get("client", {}).get("flags", []))
+
+    def on_config_changed(self, config: Dict[str, Any]) -> None:
+        """Refresh values cached from the configuration after settings are saved."""
+        self._client_flags = self._read_client_flags(config)
+
     def get_config(self) -> Dict[str, Any]:
         """Get application configuration."""
         return self.config
@@ -448,22 +614,31 @@ class MainWindow(QMainWindow):
         return self.api_client
     
     def save_window_state(self):
-        """Save window state to settings."""
-        self.settings.setValue("geometry", self.saveGeometry())
-        self.settings.setValue("windowState", self.saveState())
-        self.settings.setValue("currentTab", self.tab_widget.currentIndex())
+        """Save window state to settings, writing only keys that changed."""
+        # A window that was never shown has no meaningful geometry to persist
+        if self.isVisible():
+            self._set_cached_setting("geometry", self.saveGeometry())
+            self._set_cached_setting("windowState", self.saveState())
+        self._set_cached_setting("currentTab", self.tab_widget.currentIndex())
+
+    def _set_cached_setting(self, key: str, value) -> None:
+        """Write a setting only if it differs from the cached value."""
+        if self._settings_cache.get(key) == value:
+            return
+        self.settings.setValue(key, value)
+        self._settings_cache[key] = value
     
     def restore_window_state(self):
         """Restore window state from settings."""
-        geometry = self.settings.value("geometry")
+        geometry = self._settings_cache.get("geometry")
         if geometry:
             self.restoreGeometry(geometry)
         
-        window_state = self.settings.value("windowState")
+        window_state = self._settings_cache.get("windowState")
         if window_state:
             self.restoreState(window_state)
         
-        current_tab = self.settings.value("currentTab", 0, type=int)
+        current_tab = self._settings_cache["currentTab"]
         if 0 <= current_tab < self.tab_widget.count():
             self.tab_widget.setCurrentIndex(current_tab)
     
@@ -471,6 +646,7 @@ class MainWindow(QMainWindow):
         """Handle window close event."""
         # Save window state
         self.save_window_state()
+        self.settings.sync()
         
         # Clean up resources
         if self.api_client:
@@ -483,12 +659,7 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'refresh_timer'):
             self.refresh_timer.stop()
 
-        if getattr(self, 'albion_proc', None):
-            try:
-                if self.albion_proc.poll() is None:
-                    self.albion_proc.terminate()
-            except Exception:
-                pass
+        self._kill_client()
 
         self.logger.info("Application closing")
         event.accept()
@@ -1,15 +1,27 @@
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import QObject, QRunnable, QThread, Signal
+import queue
+import threading
 import time
 import logging
 
+from services.market_prices import STORE
+from datasources.http import get_shared_session
+from core.health import mark_online_on_data_success
+
 log = logging.getLogger(__name__)
 
+# Progress updates buffered for the GUI to poll; only the latest one matters
+PROGRESS_QUEUE_SIZE = 64
+
 
 class RefreshWorker(QObject):
-    """Background worker to refresh market data."""
+    """Background worker to refresh market data.
+
+    Progress is not signalled per update; it is queued on ``progress_queue``
+    and the GUI polls it with :meth:`drain_progress` on a timer.
+    """
 
     finished = Signal(dict)
-    progress = Signal(int, str)
     error = Signal(str)
 
     def __init__(self, params: dict, settings=None, itemsEdit=None):
@@ -20,18 +32,36 @@ class RefreshWorker(QObject):
         if itemsEdit is not None:
             self.itemsEdit = itemsEdit
         self._cancel = False
+        self.progress_queue: queue.Queue = queue.Queue(maxsize=PROGRESS_QUEUE_SIZE)
 
     def cancel(self):
         self._cancel = True
 
+    def _emit_progress(self, pct: int, msg: str) -> None:
+        """Queue fetch progress for the GUI, dropping the oldest update when full."""
+        while True:
+            try:
+                self.progress_queue.put_nowait((pct, msg))
+                return
+            except queue.Full:
+                try:
+                    self.progress_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def drain_progress(self):
+        """Return the most recent queued ``(pct, msg)`` update, or ``None``."""
+        latest = None
+        while True:
+            try:
+                latest = self.progress_queue.get_nowait()
+            except queue.Empty:
+                return latest
+
     def run(self):
         start = time.perf_counter()
-        self.progress.emit(1, "Starting market refresh...")
+        self._emit_progress(1, "Starting market refresh...")
         try:
-            from services.market_prices import STORE
-            from datasources.http import get_shared_session
-            from core.health import mark_online_on_data_success
-
             server = self.params.get("server")
             cities_sel = self.params.get("cities", "")
             qual_sel = self.params.get("qualities", "")
@@ -46,7 +76,7 @@ class RefreshWorker(QObject):
                 fetch_all=fetch_all,
                 session=get_shared_session(),
                 settings=self.settings,
-                on_progress=lambda p, m: self.progress.emit(p, m),
+                on_progress=self._emit_progress,
                 cancel=lambda: self._cancel,
             )
             if norm:
@@ -65,3 +95,158 @@ class RefreshWorker(QObject):
         except Exception as e:  # pragma: no cover - unexpected errors
             log.exception("RefreshWorker failed: %s", e)
             self.error.emit(str(e))
+
+
+class BackendInitWorker(QObject):
+    """Background worker for the slow parts of main window start-up.
+
+    Tests the AODP connection, then locates and launches the Albion Data
+    Client. Results are reported through signals so the caller can update
+    widgets and keep the process handle on the GUI thread.
+    """
+
+    connection_status = Signal(str, str)
+    client_ready = Signal(object)
+    client_missing = Signal()
+    finished = Signal()
+
+    def __init__(self, api_client=None, client_path=None, flags=(), download=False):
+        super().__init__()
+        self.api_client = api_client
+        self.client_path = client_path
+        self.flags = flags
+        # Only download the client once the user has agreed to it
+        self.download = download
+
+    def run(self):
+        try:
+            if self.api_client is not None:
+                self._test_connection()
+            self._start_client()
+        finally:
+            self.finished.emit()
+
+    def _test_connection(self):
+        try:
+            if self.api_client.test_connection():
+                log.info("API connection test successful")
+                self.connection_status.emit("🟢 Connected", "API connection active")
+            else:
+                log.warning("API connection test failed")
+                self.connection_status.emit("🟡 Limited", "API connection issues")
+        except Exception as e:
+            log.error(f"API connection test error: {e}")
+            self.connection_status.emit("🔴 Disconnected", f"API connection error: {e}")
+
+    def _start_client(self):
+        from services.albion_client import (
+            capture_subproc_version,
+            find_client,
+            launch_client_with_fallback,
+        )
+
+        client_path = find_client(
+            self.client_path,
+            ask_download=(lambda: True) if self.download else None,
+        )
+        if not client_path:
+            self.client_missing.emit()
+            return
+        try:
+            proc = launch_client_with_fallback(client_path, list(self.flags))
+            capture_subproc_version(client_path)
+        except Exception as e:
+            log.exception("Failed to launch Albion Data Client: %s", e)
+            return
+        self.client_ready.emit(proc)
+
+
+class HealthProbeWorker(QObject):
+    """Ping AODP for ``server`` off the GUI thread.
+
+    ``core.health.store`` is updated by the ping itself (emitting
+    ``health_changed`` on a state change); ``finished`` carries the result.
+    """
+
+    finished = Signal(bool)
+
+    def __init__(self, server: str):
+        super().__init__()
+        self.server = server
+
+    def run(self):
+        import core.health as health
+
+        ok = False
+        try:
+            ok = bool(health.ping_aodp(self.server))
+        except Exception as e:  # pragma: no cover - defensive
+            log.warning("AODP health probe failed: %s", e)
+        finally:
+            self.finished.emit(ok)
+
+
+class IconFetchWorker(QObject):
+    """Fetch the icon bytes for one ``(item_id, quality)`` off the GUI thread.
+
+    Only bytes cross the thread boundary; ``QPixmap``/``QIcon`` must be built
+    by the receiver on the GUI thread. ``finished`` carries ``None`` on failure.
+    """
+
+    finished = Signal(str, int, object)
+
+    def __init__(self, item_id: str, quality: int, fetch):
+        super().__init__()
+        self.item_id = item_id
+        self.quality = quality
+        self.fetch = fetch
+
+    def run(self):
+        data = None
+        try:
+            data = self.fetch(self.item_id, self.quality)
+        except Exception as e:
+            log.debug("Icon fetch failed for %s q%s: %s", self.item_id, self.quality, e)
+        finally:
+            self.finished.emit(self.item_id, self.quality, data)
+
+
+class ProcessWatcher(QObject):
+    """Report when a child process exits without polling it from the GUI.
+
+    A daemon thread blocks in ``wait()``; the exit code is delivered through
+    ``exited`` as a queued signal. A pool thread is not used because the
+    wait lasts for the lifetime of the process.
+    """
+
+    exited = Signal(int)
+
+    def __init__(self, proc):
+        super().__init__()
+        self.proc = proc
+
+    def start(self):
+        threading.Thread(target=self._wait, name="process-watcher", daemon=True).start()
+
+    def _wait(self):
+        code = self.proc.wait()
+        try:
+            self.exited.emit(code)
+        except RuntimeError:  # pragma: no cover - watcher deleted at shutdown
+            pass
+
+
+class WorkerRunnable(QRunnable):
+    """Run a worker object's ``run`` method on a ``QThreadPool`` thread.
+
+    The worker stays owned by the caller (and thus the GUI thread) so its
+    signals are delivered to GUI slots as queued connections.
+    """
+
+    def __init__(self, worker: QObject):
+        super().__init__()
+        self.worker = worker
+        self.setAutoDelete(True)
+
+    def run(self):
+        self.worker.run()
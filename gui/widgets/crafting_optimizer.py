@@ -5,14 +5,9 @@ Allows users to analyze crafting opportunities and optimize production chains.
 """
 
 import logging
-from typing import List, Dict, Any
 
-from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QGroupBox, QFrame
-)
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
 
 
 class CraftingOptimizerWidget(QWidget):
@@ -28,51 +23,16 @@ class CraftingOptimizerWidget(QWidget):
         self.init_ui()
     
     def init_ui(self):
-        """Initialize the user interface."""
+        """Initialize the user interface (empty state until crafting lands)."""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(10)
         
-        # Create header
-        self.create_header(layout)
-        
-        # Create empty state content
-        self.create_empty_state(layout)
-    
-    def create_header(self, parent_layout):
-        """Create header with title."""
-        header_frame = QFrame()
-        header_frame.setFrameStyle(QFrame.StyledPanel)
-        header_layout = QHBoxLayout(header_frame)
-        
-        # Title
-        title_label = QLabel("🔨 Crafting Optimizer")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        header_layout.addWidget(title_label)
-        
-        header_layout.addStretch()
-        
-        parent_layout.addWidget(header_frame)
-    
-    def create_empty_state(self, parent_layout):
-        """Create empty state content."""
-        content_group = QGroupBox("Crafting Analysis")
-        content_layout = QVBoxLayout(content_group)
-        
-        # Empty state message
-        msg = QLabel("No crafting data yet — feature not implemented")
+        msg = QLabel("🔨 Crafting — no crafting data yet, feature not implemented")
         msg.setAlignment(Qt.AlignCenter)
         msg.setStyleSheet("color: gray; font-size: 14px;")
-        content_layout.addWidget(msg)
-        
-        parent_layout.addWidget(content_group)
-        parent_layout.addStretch()
+        layout.addWidget(msg)
     
     def refresh_data(self):
         """Refresh data (called from main window)."""
         self.logger.debug("Crafting optimizer refresh requested")
         pass
-
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -10,19 +12,35 @@ from PySide6.QtWidgets import (
     QTableWidget,
     QTableWidgetItem,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, Slot
 
 from core.signals import signals
+from services.market_prices import STORE
 from utils.timefmt import rel_age, fmt_tooltip
 
 
 class DashboardWidget(QWidget):
     """Dashboard showing last update, record count and top opportunities."""
 
+    # Read-only, selectable cells; combined once rather than per new item
+    _CELL_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
     def __init__(self, *a, **kw):
         super().__init__(*a, **kw)
+        # Latest summary received while hidden; rendered on the next show
+        self._pending_summary: dict | None = None
+        # Coalesce bursts of market_data_ready into one render of the latest summary
+        self._coalesce = QTimer(self)
+        self._coalesce.setSingleShot(True)
+        self._coalesce.setInterval(150)
+        self._coalesce.timeout.connect(self._apply_pending)
+        # Opportunity count of the last render; -1 forces a rebuild
+        self._last_rowcount = -1
+        # Last summary handed to _render_summary, so a reconnect doesn't redraw it
+        self._rendered_summary: dict | None = None
         self._build_ui()
         signals.market_data_ready.connect(self.on_market_data_ready)
+        self._connected = True
         self.set_loading_state(True)
 
     # ------------------------------------------------------------------
@@ -49,11 +67,27 @@ class DashboardWidget(QWidget):
         self.topTable.setSelectionMode(QTableWidget.NoSelection)
         layout.addWidget(self.topTable)
 
+    @staticmethod
+    def _setLabel(label: QLabel, text: str, tooltip: str | None = None) -> None:
+        """Update ``label`` only when its text or tooltip actually changed."""
+        if label.text() != text:
+            label.setText(text)
+        if tooltip is not None and label.toolTip() != tooltip:
+            label.setToolTip(tooltip)
+
     def _setCell(self, row: int, col: int, text: str, tooltip: str | None = None) -> None:
+        item = self.topTable.item(row, col)
+        if item is not None:
+            # Reuse the existing cell; only rewrite what changed
+            if item.text() != text:
+                item.setText(text)
+            if (tooltip or "") != item.toolTip():
+                item.setToolTip(tooltip or "")
+            return
         item = QTableWidgetItem(text)
         if tooltip:
             item.setToolTip(tooltip)
-        item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+        item.setFlags(self._CELL_FLAGS)
         self.topTable.setItem(row, col, item)
 
     # ------------------------------------------------------------------
@@ -61,35 +95,93 @@ class DashboardWidget(QWidget):
     # ------------------------------------------------------------------
     def set_loading_state(self, loading: bool) -> None:
         if loading:
-            self.lblLastUpdate.setText("Loading…")
+            self._setLabel(self.lblLastUpdate, "Loading…")
             self.topTable.clearContents()
             self.topTable.setRowCount(0)
+            self._last_rowcount = -1
         self.cards.setLoading(loading) if hasattr(self, "cards") else None
 
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if not self._connected:
+            signals.market_data_ready.connect(self.on_market_data_ready)
+            self._connected = True
+            # Pick up whatever was emitted while we weren't listening
+            latest = STORE.last_summary()
+            if self._pending_summary is None and latest is not self._rendered_summary:
+                self._pending_summary = latest
+        self._apply_pending()
+
+    def hideEvent(self, event) -> None:
+        # Off-screen: stop listening instead of queueing renders nobody sees
+        if self._connected:
+            try:
+                signals.market_data_ready.disconnect(self.on_market_data_ready)
+            except (RuntimeError, TypeError):
+                pass
+            self._connected = False
+        self._coalesce.stop()
+        super().hideEvent(event)
+
+    @Slot(dict)
     def on_market_data_ready(self, summary: dict) -> None:
+        self._pending_summary = summary
+        # Hidden: render on the next show instead
+        if self.isVisible():
+            self._coalesce.start()
+
+    @Slot()
+    def _apply_pending(self) -> None:
+        if self._pending_summary is None or not self.isVisible():
+            return
+        summary, self._pending_summary = self._pending_summary, None
+        self._coalesce.stop()
+        self._rendered_summary = summary
+        self._render_summary(summary)
+
+    def _render_summary(self, summary: dict) -> None:
         self.set_loading_state(False)
+        # One reference time for every age shown in this render
+        now = datetime.now(timezone.utc)
         ts = summary.get("last_update_utc")
         if ts:
-            self.lblLastUpdate.setText(f"{rel_age(ts)} ago")
-            self.lblLastUpdate.setToolTip(fmt_tooltip(ts))
-        self.lblRecords.setText(str(summary.get("records", 0)))
+            self._setLabel(self.lblLastUpdate, f"{rel_age(ts, now)} ago", fmt_tooltip(ts))
+        self.lblRecords.setNum(int(summary.get("records", 0) or 0))
+
+        # Suppress per-cell repaints and re-sorting while the table is refilled
+        table = self.topTable
+        sorting = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        table.blockSignals(True)
+        try:
+            self._fill_table(summary.get("top_opportunities") or [], now)
+        finally:
+            table.blockSignals(False)
+            table.setSortingEnabled(sorting)
+            table.setUpdatesEnabled(True)
+        table.viewport().update()
 
-        tops = summary.get("top_opportunities") or []
-        self.topTable.clearContents()
-        self.topTable.setRowCount(len(tops))
+    def _fill_table(self, tops: list[dict], now: datetime) -> None:
+        if len(tops) != self._last_rowcount:
+            # Row count changed: rebuild. Otherwise cells are updated in place.
+            self.topTable.clearContents()
+            self.topTable.setRowCount(len(tops))
+        self._last_rowcount = len(tops)
+        # Rows from one fetch often share a timestamp; format each one once
+        ages: dict = {}
         for i, t in enumerate(tops):
+            ts = t["updated_dt"]
+            age = ages.get(ts)
+            if age is None:
+                age = ages[ts] = (rel_age(ts, now), fmt_tooltip(ts))
             self._setCell(i, 0, t["item"])
             self._setCell(i, 1, f'{t["buy_city"]} \u2192 {t["sell_city"]}')
             self._setCell(i, 2, str(t["buy_price"]))
             self._setCell(i, 3, str(t["sell_price"]))
             self._setCell(i, 4, f'{t["spread"]}')
             self._setCell(i, 5, f'{t["roi_pct"]:.1f}%')
-            self._setCell(
-                i,
-                6,
-                rel_age(t["updated_dt"]),
-                tooltip=fmt_tooltip(t["updated_dt"]),
-            )
+            self._setCell(i, 6, age[0], tooltip=age[1])
         if not tops:
             self.topTable.setRowCount(1)
             self._setCell(
@@ -4,23 +4,113 @@ Data Manager widget for Albion Trade Optimizer.
 Manages data sources, caching, and import/export functionality.
 """
 
+from __future__ import annotations
+
 import logging
+import time
 from datetime import datetime
 from typing import Dict, Any
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QPushButton, QGroupBox, QFrame, QTextEdit,
-    QProgressBar, QTableWidget, QTableWidgetItem,
+    QProgressBar, QTableView,
     QHeaderView, QMessageBox, QComboBox
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QThreadPool, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QFont, QColor
 from core.signals import signals
+from gui.threads import HealthProbeWorker, WorkerRunnable
+
+
+SOURCE_COLUMNS = ["Source", "Status", "Last Update", "Records"]
+
+
+class SourcesModel(QAbstractTableModel):
+    """Small read-only model for the data sources table.
+
+    ``setRows`` signals a single ``dataChanged`` covering the cells whose text
+    changed, so a periodic refresh costs at most one repaint and none when the
+    values are the same.
+    """
+
+    def __init__(self, rows: list[list[str]] | None = None):
+        super().__init__()
+        self.rows = rows or []
+
+    def rowCount(self, parent=QModelIndex()): return len(self.rows)
+    def columnCount(self, parent=QModelIndex()): return len(SOURCE_COLUMNS)
+
+    def data(self, idx: QModelIndex, role=Qt.DisplayRole):
+        if not idx.isValid() or role != Qt.DisplayRole:
+            return None
+        return self.rows[idx.row()][idx.column()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return SOURCE_COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def setRows(self, rows: list[list[str]]):
+        if len(rows) != len(self.rows):
+            self.beginResetModel()
+            self.rows = rows
+            self.endResetModel()
+            return
+        changed = []
+        for r, (old, new) in enumerate(zip(self.rows, rows)):
+            if old == new:
+                continue
+            changed.extend((r, c) for c, (a, b) in enumerate(zip(old, new)) if a != b)
+            # Rows are replaced, never mutated, so callers may pass shared rows
+            self.rows[r] = new
+        if changed:
+            # One notification for the bounding block instead of one per cell
+            rs = [r for r, _ in changed]
+            cs = [c for _, c in changed]
+            self.dataChanged.emit(
+                self.index(min(rs), min(cs)), self.index(max(rs), max(cs)), [Qt.DisplayRole]
+            )
 
 
 class DataManagerWidget(QWidget):
     """Widget for managing data sources and operations."""
+
+    _CARD_STYLE = """
+            QGroupBox {{
+                border: 2px solid {name};
+                border-radius: 8px;
+                margin-top: 10px;
+                background-color: rgba({r}, {g}, {b}, 0.1);
+            }}
+        """
+    # Seconds a get_database_stats() result is reused by update_status
+    _STATS_TTL = 60.0
+    # Shared by every instance and status card; created on first use
+    # (QFont needs a QApplication)
+    _header_font = None
+    _title_font = None
+    _value_font = None
+
+    @classmethod
+    def _fonts(cls):
+        """Return the shared ``(header, card title, card value)`` fonts."""
+        if cls._title_font is None:
+            cls._header_font = QFont()
+            cls._header_font.setPointSize(16)
+            cls._header_font.setBold(True)
+            cls._title_font = QFont()
+            cls._title_font.setBold(True)
+            cls._value_font = QFont()
+            cls._value_font.setPointSize(12)
+            cls._value_font.setBold(True)
+        return cls._header_font, cls._title_font, cls._value_font
+
+    @staticmethod
+    def _set_text(label: QLabel, text: str) -> None:
+        """Set ``label`` text only when it differs, sparing a relayout/repaint."""
+        if label.text() != text:
+            label.setText(text)
     
     def __init__(self, main_window):
         """Initialize data manager widget."""
@@ -31,13 +121,28 @@ class DataManagerWidget(QWidget):
         
         # Data status
         self.last_update = None
+        # time.monotonic() of last_update, for the data-age card
+        self._last_update_monotonic = None
         self.data_stats = {}
         self.api_online = False
+        # (monotonic time, stats) of the last get_database_stats() call
+        self._stats_cache = None
+        # Set when an update was skipped because the widget was hidden
+        self._dirty = False
+        # AODP ping running on the thread pool; one at a time
+        self._probe = None
+        self._probe_inflight = False
 
         self.init_ui()
+        # Health flips can arrive in bursts (e.g. while AODP is flapping);
+        # queue them onto the GUI thread and redraw once they settle
+        self._health_debounce = QTimer(self)
+        self._health_debounce.setSingleShot(True)
+        self._health_debounce.setInterval(200)
+        self._health_debounce.timeout.connect(lambda: self.on_health_changed(None))
+        signals.health_changed.connect(self._on_health_changed_raw, Qt.QueuedConnection)
+        # The first update_status also starts the first API probe
         self.init_timer()
-        signals.health_changed.connect(self.on_health_changed)
-        self.refreshApiStatus()
     
     def init_ui(self):
         """Initialize the user interface."""
@@ -68,10 +173,7 @@ class DataManagerWidget(QWidget):
         
         # Title
         title_label = QLabel("📡 Data Manager")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(self._fonts()[0])
         header_layout.addWidget(title_label)
         
         header_layout.addStretch()
@@ -100,17 +202,17 @@ class DataManagerWidget(QWidget):
     def create_status_cards(self, parent_layout):
         """Create status information cards."""
         # API Status card
-        self.api_status_card = self.create_status_card(
+        self.api_status_card, self.api_status_value, self.api_status_sub = self.create_status_card(
             "🌐 API Status",
             "Checking...",
             "AODP Connection",
             QColor(25, 118, 210)
         )
         parent_layout.addWidget(self.api_status_card, 0, 0)
-        self.lblApiStatus = self.api_status_card.value_label
+        self.lblApiStatus = self.api_status_value
         
         # Database Status card
-        self.db_status_card = self.create_status_card(
+        self.db_status_card, self.db_status_value, self.db_status_sub = self.create_status_card(
             "💾 Database",
             "Checking...",
             "Local Storage",
@@ -119,7 +221,7 @@ class DataManagerWidget(QWidget):
         parent_layout.addWidget(self.db_status_card, 0, 1)
         
         # Data Freshness card
-        self.freshness_card = self.create_status_card(
+        self.freshness_card, self.freshness_value, self.freshness_sub = self.create_status_card(
             "🕒 Data Age",
             "Unknown",
             "Last Update",
@@ -128,7 +230,7 @@ class DataManagerWidget(QWidget):
         parent_layout.addWidget(self.freshness_card, 0, 2)
         
         # Cache Size card
-        self.cache_card = self.create_status_card(
+        self.cache_card, self.cache_value, self.cache_sub = self.create_status_card(
             "📊 Cache Size",
             "Unknown",
             "Stored Records",
@@ -136,34 +238,31 @@ class DataManagerWidget(QWidget):
         )
         parent_layout.addWidget(self.cache_card, 0, 3)
     
-    def create_status_card(self, title: str, value: str, subtitle: str, color: QColor) -> QGroupBox:
-        """Create a status card widget."""
+    def create_status_card(
+        self, title: str, value: str, subtitle: str, color: QColor
+    ) -> tuple[QGroupBox, QLabel, QLabel]:
+        """Create a status card widget.
+
+        Returns ``(card, value_label, subtitle_label)``; the caller keeps the
+        two labels as plain attributes for updates.
+        """
         card = QGroupBox()
         card.setFixedHeight(100)
-        card.setStyleSheet(f"""
-            QGroupBox {{
-                border: 2px solid {color.name()};
-                border-radius: 8px;
-                margin-top: 10px;
-                background-color: rgba({color.red()}, {color.green()}, {color.blue()}, 0.1);
-            }}
-        """)
+        card.setStyleSheet(self._CARD_STYLE.format(
+            name=color.name(), r=color.red(), g=color.green(), b=color.blue()
+        ))
+        _, title_font, value_font = self._fonts()
         
         layout = QVBoxLayout(card)
         layout.setContentsMargins(10, 15, 10, 10)
         
         # Title
         title_label = QLabel(title)
-        title_font = QFont()
-        title_font.setBold(True)
         title_label.setFont(title_font)
         layout.addWidget(title_label)
         
         # Value
         value_label = QLabel(value)
-        value_font = QFont()
-        value_font.setPointSize(12)
-        value_font.setBold(True)
         value_label.setFont(value_font)
         value_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(value_label)
@@ -174,11 +273,7 @@ class DataManagerWidget(QWidget):
         subtitle_label.setStyleSheet("color: gray;")
         layout.addWidget(subtitle_label)
         
-        # Store labels for updates
-        card.value_label = value_label
-        card.subtitle_label = subtitle_label
-        
-        return card
+        return card, value_label, subtitle_label
     
     def create_data_operations_section(self, parent_layout):
         """Create data operations section."""
@@ -221,11 +316,9 @@ class DataManagerWidget(QWidget):
         sources_layout = QVBoxLayout(sources_group)
         
         # Data sources table
-        self.sources_table = QTableWidget()
-        self.sources_table.setColumnCount(4)
-        self.sources_table.setHorizontalHeaderLabels([
-            "Source", "Status", "Last Update", "Records"
-        ])
+        self.sources_model = SourcesModel()
+        self.sources_table = QTableView()
+        self.sources_table.setModel(self.sources_model)
         
         # Configure table
         header = self.sources_table.horizontalHeader()
@@ -258,15 +351,35 @@ class DataManagerWidget(QWidget):
     
     def init_timer(self):
         """Initialize status update timer."""
-        self.status_timer = QTimer()
+        self.status_timer = QTimer(self)
+        # Housekeeping tick: second-level accuracy lets Qt/the OS batch wakeups
+        self.status_timer.setTimerType(Qt.VeryCoarseTimer)
+        self.status_timer.setSingleShot(False)
         self.status_timer.timeout.connect(self.update_status)
-        self.status_timer.start(30000)  # Update every 30 seconds
+        self.status_timer.start(60000)  # Update every minute; data age is shown in 0.1h steps
 
         # Initial status update
         self.update_status()
     
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if self._dirty:
+            # Catch up once on whatever was skipped while hidden
+            self.update_status()
+        if not self.status_timer.isActive():
+            self.status_timer.start()
+
+    def hideEvent(self, event) -> None:
+        # No polling while another tab is in front
+        self.status_timer.stop()
+        super().hideEvent(event)
+
     def update_status(self):
         """Update data status information."""
+        if not self.isVisible():
+            self._dirty = True
+            return
+        self._dirty = False
         try:
             # Check API status via shared health ping
             self.refreshApiStatus()
@@ -276,30 +389,29 @@ class DataManagerWidget(QWidget):
             if db_manager:
                 try:
                     # Try to get some basic stats
-                    stats = db_manager.get_database_stats()
-                    self.db_status_card.value_label.setText("🟢 Ready")
-                    self.db_status_card.subtitle_label.setText(f"{stats.get('total_records', 0)} records")
+                    stats = self._database_stats(db_manager)
+                    self._set_text(self.db_status_value, "🟢 Ready")
+                    self._set_text(self.db_status_sub, f"{stats.get('total_records', 0)} records")
                     
                     # Update cache card
-                    self.cache_card.value_label.setText(f"{stats.get('total_records', 0):,}")
-                    self.cache_card.subtitle_label.setText("Price Records")
+                    self._set_text(self.cache_value, f"{stats.get('total_records', 0):,}")
+                    self._set_text(self.cache_sub, "Price Records")
                     
                 except Exception:
-                    self.db_status_card.value_label.setText("🟡 Limited")
-                    self.db_status_card.subtitle_label.setText("Access Issues")
+                    self._set_text(self.db_status_value, "🟡 Limited")
+                    self._set_text(self.db_status_sub, "Access Issues")
             else:
-                self.db_status_card.value_label.setText("❌ N/A")
-                self.db_status_card.subtitle_label.setText("Not Initialized")
+                self._set_text(self.db_status_value, "❌ N/A")
+                self._set_text(self.db_status_sub, "Not Initialized")
             
             # Update data freshness
-            if self.last_update:
-                age = datetime.now() - self.last_update
-                hours = age.total_seconds() / 3600
-                self.freshness_card.value_label.setText(f"{hours:.1f}h")
-                self.freshness_card.subtitle_label.setText("Since Last Update")
+            if self._last_update_monotonic is not None:
+                hours = (time.monotonic() - self._last_update_monotonic) / 3600
+                self._set_text(self.freshness_value, f"{hours:.1f}h")
+                self._set_text(self.freshness_sub, "Since Last Update")
             else:
-                self.freshness_card.value_label.setText("Never")
-                self.freshness_card.subtitle_label.setText("No Updates")
+                self._set_text(self.freshness_value, "Never")
+                self._set_text(self.freshness_sub, "No Updates")
             
             # Update data sources table
             self.update_sources_table()
@@ -307,59 +419,74 @@ class DataManagerWidget(QWidget):
         except Exception as e:
             self.logger.error(f"Failed to update status: {e}")
 
+    def _database_stats(self, db_manager) -> Dict[str, Any]:
+        """Return ``db_manager.get_database_stats()``, cached for ``_STATS_TTL``."""
+        now = time.monotonic()
+        if self._stats_cache and now - self._stats_cache[0] < self._STATS_TTL:
+            return self._stats_cache[1]
+        stats = db_manager.get_database_stats()
+        self._stats_cache = (now, stats)
+        return stats
+
+    def _on_health_changed_raw(self, store) -> None:
+        self._health_debounce.start()
+
     def on_health_changed(self, store) -> None:
+        if not self.isVisible():
+            self._dirty = True
+            return
         from core.health import store as health_store
 
         self.api_online = health_store.aodp_online
+        # lblApiStatus is the API card's value label
         if health_store.aodp_online:
-            self.lblApiStatus.setText("Online")
-            self.api_status_card.value_label.setText("🟢 Online")
-            self.api_status_card.subtitle_label.setText("AODP Connection")
+            self._set_text(self.api_status_value, "🟢 Online")
+            self._set_text(self.api_status_sub, "AODP Connection")
         else:
-            self.lblApiStatus.setText("Offline")
-            self.api_status_card.value_label.setText("🔴 Offline")
-            self.api_status_card.subtitle_label.setText("Check network / rate limits")
+            self._set_text(self.api_status_value, "🔴 Offline")
+            self._set_text(self.api_status_sub, "Check network / rate limits")
         self.update_sources_table()
 
     def refreshApiStatus(self):
-        from core.health import ping_aodp
-
+        """Ping AODP on the thread pool; the card is redrawn when it finishes."""
+        if self._probe_inflight:
+            return
+        self._probe_inflight = True
         server = self.server_combo.currentText().strip().lower()
-        ping_aodp(server)
+        self._probe = HealthProbeWorker(server)
+        self._probe.finished.connect(self._on_probe_finished)
+        QThreadPool.globalInstance().start(WorkerRunnable(self._probe))
+
+    def _on_probe_finished(self, online: bool) -> None:
+        self._probe_inflight = False
+        self._probe = None
         # redraw using store
         self.on_health_changed(None)
     
     def update_sources_table(self):
         """Update data sources table."""
         try:
-            sources = [
-                {
-                    'name': 'AODP API',
-                    'status': '🟢 Online' if self.api_online else '🔴 Offline',
-                    'last_update': self.last_update.strftime('%H:%M:%S') if self.last_update else 'Never',
-                    'records': 'Real-time'
-                },
-                {
-                    'name': 'Local Database',
-                    'status': '🟢 Ready' if self.main_window.get_db_manager() else '🔴 Error',
-                    'last_update': 'Continuous',
-                    'records': f"{self.data_stats.get('total_records', 0):,}"
-                },
-                {
-                    'name': 'Recipe Data',
-                    'status': '🟢 Loaded',
-                    'last_update': 'Static',
-                    'records': f"{self.data_stats.get('recipe_count', 9):,}"
-                }
-            ]
-            
-            self.sources_table.setRowCount(len(sources))
-            
-            for row, source in enumerate(sources):
-                self.sources_table.setItem(row, 0, QTableWidgetItem(source['name']))
-                self.sources_table.setItem(row, 1, QTableWidgetItem(source['status']))
-                self.sources_table.setItem(row, 2, QTableWidgetItem(source['last_update']))
-                self.sources_table.setItem(row, 3, QTableWidgetItem(source['records']))
+            # Only the status/update/record cells vary; the rest are literals
+            self.sources_model.setRows([
+                [
+                    'AODP API',
+                    '🟢 Online' if self.api_online else '🔴 Offline',
+                    self.last_update.strftime('%H:%M:%S') if self.last_update else 'Never',
+                    'Real-time',
+                ],
+                [
+                    'Local Database',
+                    '🟢 Ready' if self.main_window.get_db_manager() else '🔴 Error',
+                    'Continuous',
+                    f"{self.data_stats.get('total_records', 0):,}",
+                ],
+                [
+                    'Recipe Data',
+                    '🟢 Loaded',
+                    'Static',
+                    f"{self.data_stats.get('recipe_count', 9):,}",
+                ],
+            ])
             
         except Exception as e:
             self.logger.error(f"Failed to update sources table: {e}")
@@ -380,6 +507,8 @@ class DataManagerWidget(QWidget):
             # Trigger refresh in main window
             self.main_window.refresh_data()
             self.last_update = datetime.now()
+            self._last_update_monotonic = time.monotonic()
+            self._stats_cache = None
             self.set_status("Market data refreshed successfully")
             
         except Exception as e:
@@ -405,11 +534,13 @@ class DataManagerWidget(QWidget):
                 db_manager = self.main_window.get_db_manager()
                 if db_manager:
                     db_manager.clear_cache()
+                self._stats_cache = None
                 
                 # Clear application cache
                 self.main_window.clear_cache()
                 
                 self.last_update = None
+                self._last_update_monotonic = None
                 self.data_stats = {}
                 self.set_status("Cache cleared successfully")
                 self.update_status()
@@ -449,6 +580,6 @@ class DataManagerWidget(QWidget):
     
     def set_status(self, message: str):
         """Set status message."""
-        self.status_label.setText(message)
+        self._set_text(self.status_label, message)
         self.logger.debug(f"Data manager status: {message}")
 
@@ -5,49 +5,256 @@ Allows users to search for and analyze flip opportunities.
 """
 
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QPushButton, QLineEdit, QComboBox, QSpinBox,
-    QTableWidget, QTableWidgetItem, QGroupBox,
+    QTableView, QGroupBox,
     QHeaderView, QAbstractItemView, QSplitter, QTextEdit,
     QProgressBar, QFrame, QDoubleSpinBox
 )
-from PySide6.QtCore import Qt, QThread, Signal, QSize
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject, QThreadPool, QTimer, Signal, QSize
 from PySide6.QtGui import QFont, QIcon, QPixmap
 
 from services.item_icons import fetch_icon_bytes
+from gui.threads import IconFetchWorker, WorkerRunnable
 from utils.timefmt import rel_age
 from utils.items import parse_item_input
-from utils.params import parse_quality_input, parse_city_selection
-import pandas as pd
-from datetime import datetime
+from utils.params import parse_city_selection
+from datetime import datetime, timezone
 
-from services.flip_engine import build_flips
+from services.flip_engine import build_flips, prefilter_rows, price_columns
 from services.market_prices import STORE
 
 log = logging.getLogger(__name__)
 
+# Results are handed to the GUI in chunks of this size so rows show up
+# before the whole list has crossed the signal boundary
+PARTIAL_CHUNK = 25
+
+ALL_CITIES = ("Martlock", "Lymhurst", "Bridgewatch", "Fort Sterling", "Thetford", "Caerleon")
+ALL_QUALITIES = (1, 2, 3, 4, 5)
+# Quality combo entries; the code is stored as item data so a search needs no parsing
+QUALITY_CHOICES = (
+    ("Normal (1)", 1),
+    ("Good (2)", 2),
+    ("Outstanding (3)", 3),
+    ("Excellent (4)", 4),
+    ("Masterpiece (5)", 5),
+    ("All", None),
+)
+
+
+# Accepted spellings of the buy and sell price fields, in order of preference
+BUY_KEYS = ("buy_price_max", "buy_max", "BuyMax")
+SELL_KEYS = ("sell_price_min", "sell_min", "SellMin")
+
+
+def _coalesce_prices(frame: pd.DataFrame, keys: tuple) -> np.ndarray:
+    """Return the first numeric value among ``keys`` per row, 0.0 when none is."""
+    out = pd.to_numeric(frame[keys[0]], errors="coerce").to_numpy(dtype=np.float64)
+    for key in keys[1:]:
+        missing = np.isnan(out)
+        if not missing.any():
+            break
+        alt = pd.to_numeric(frame[key], errors="coerce").to_numpy(dtype=np.float64)
+        out = np.where(missing, alt, out)
+    return np.where(np.isnan(out), 0.0, out)
+
+
+def _normalize_price_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copy the rows that have a price, with canonical float ``buy``/``sell`` keys.
+
+    Prices are coalesced column-wise over every row at once; only the rows that
+    survive the ``buy > 0 or sell > 0`` mask are copied.
+    """
+    if not rows:
+        return []
+    frame = pd.DataFrame.from_records(rows, columns=list(BUY_KEYS + SELL_KEYS))
+    buy = _coalesce_prices(frame, BUY_KEYS)
+    sell = _coalesce_prices(frame, SELL_KEYS)
+    keep = np.flatnonzero((buy > 0) | (sell > 0))
+    trimmed = []
+    for i, buy_val, sell_val in zip(keep.tolist(), buy[keep].tolist(), sell[keep].tolist()):
+        row_norm = dict(rows[i])
+        row_norm["buy_price_max"] = row_norm["buy"] = buy_val
+        row_norm["sell_price_min"] = row_norm["sell"] = sell_val
+        trimmed.append(row_norm)
+    return trimmed
+
+
+def _results_signature(flips: List[Dict[str, Any]]) -> int:
+    """Return a hash of everything the results table shows for ``flips``."""
+    return hash(tuple(
+        (f.get("item_id"), f.get("quality"), f.get("buy_city"), f.get("sell_city"),
+         f.get("buy"), f.get("sell"), f.get("updated_epoch_hours"))
+        for f in flips
+    ))
+
+
+RESULT_COLUMNS = ("Item", "Route", "Buy", "Sell", "Spread", "ROI %", "Updated")
+# Flip keys shown raw in the numeric columns 2..5
+_NUMERIC_KEYS = ("buy", "sell", "spread", "roi_pct")
+_UPDATED_COLUMN = 6
+
+
+class FlipsTableModel(QAbstractTableModel):
+    """Read-only model behind the flip results view.
+
+    Display values are computed once per row. Numeric columns (and the update
+    timestamp) are also kept as float arrays so :meth:`sort` is a single NumPy
+    argsort rather than a Python comparison for every pair of rows.
+    """
+
+    def __init__(self, icon_for=None, parent=None):
+        super().__init__(parent)
+        self._icon_for = icon_for
+        self._flips: List[Dict[str, Any]] = []
+        self._rows: List[tuple] = []
+        self._keys = np.empty((0, len(RESULT_COLUMNS)), dtype=np.float64)
+        self._sort: Optional[Tuple[int, Qt.SortOrder]] = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(RESULT_COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return RESULT_COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, idx: QModelIndex, role=Qt.DisplayRole):
+        if not idx.isValid():
+            return None
+        row, col = idx.row(), idx.column()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._rows[row][col]
+        if col == 0:
+            if role == Qt.UserRole:
+                return self._flips[row]
+            if role == Qt.DecorationRole and self._icon_for is not None:
+                return self._icon_for(*self._icon_key(self._flips[row]))
+        elif col == _UPDATED_COLUMN and role == Qt.UserRole:
+            epoch = self._keys[row, col]
+            return None if np.isnan(epoch) else int(epoch)
+        return None
+
+    def flip(self, row: int) -> Dict[str, Any]:
+        return self._flips[row]
+
+    @staticmethod
+    def _icon_key(flip: Dict[str, Any]) -> Tuple[str, int]:
+        return (flip.get("item_id") or flip.get("item") or "", flip.get("quality") or 1)
+
+    def _build(self, flips: List[Dict[str, Any]]) -> Tuple[List[tuple], np.ndarray]:
+        # One reference time per fill; results from one fetch share timestamps,
+        # so each distinct one is converted and formatted once
+        now = datetime.now(timezone.utc)
+        ages: Dict[Any, tuple] = {}
+        rows = []
+        keys = np.full((len(flips), len(RESULT_COLUMNS)), np.nan)
+        for r, flip in enumerate(flips):
+            item_id = flip.get("item_id") or flip.get("item") or ""
+            route_str = f"{flip['buy_city']} → {flip['sell_city']}"
+            flip.setdefault("route", route_str)
+            numbers = tuple(flip[k] for k in _NUMERIC_KEYS)
+
+            udisp = flip.get("updated") or ""
+            udt = flip.get("updated_dt")
+            if isinstance(udt, datetime):  # pd.Timestamp is a datetime subclass
+                age = ages.get(udt)
+                if age is None:
+                    age = ages[udt] = (rel_age(udt, now), int(udt.timestamp()))
+                if not udisp:
+                    udisp = age[0]
+                keys[r, _UPDATED_COLUMN] = age[1]
+            keys[r, 2:6] = numbers
+            rows.append((flip.get("item_name") or item_id or "—", route_str) + numbers + (str(udisp),))
+            if self._icon_for is not None:
+                self._icon_for(*self._icon_key(flip))  # start fetching it early
+        return rows, keys
+
+    def setRows(self, flips: List[Dict[str, Any]]) -> None:
+        """Replace the rows, re-applying the current sort."""
+        rows, keys = self._build(flips)
+        if rows and len(rows) == len(self._rows):
+            # Same shape: one dataChanged keeps the view's selection and scroll
+            self._flips, self._rows, self._keys = list(flips), rows, keys
+            self.dataChanged.emit(self.index(0, 0), self.index(len(rows) - 1, len(RESULT_COLUMNS) - 1))
+        else:
+            self.beginResetModel()
+            self._flips, self._rows, self._keys = list(flips), rows, keys
+            self.endResetModel()
+        if self._sort is not None:
+            self.sort(*self._sort)
+
+    def appendRows(self, flips: List[Dict[str, Any]]) -> None:
+        """Append rows unsorted; used while results are still streaming in."""
+        if not flips:
+            return
+        rows, keys = self._build(flips)
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._flips.extend(flips)
+        self._rows.extend(rows)
+        self._keys = np.concatenate((self._keys, keys))
+        self.endInsertRows()
+
+    def sort(self, column: int, order=Qt.AscendingOrder) -> None:
+        if not 0 <= column < len(RESULT_COLUMNS):
+            self._sort = None  # the view asks for column -1 to mean "unsorted"
+            return
+        self._sort = (column, order)
+        n = len(self._rows)
+        if n < 2:
+            return
+        descending = order == Qt.DescendingOrder
+        if 2 <= column <= _UPDATED_COLUMN:
+            keys = self._keys[:, column]
+            # Stable, so equal keys keep their order; rows without a value go last
+            perm = np.argsort(-keys if descending else keys, kind="stable")
+        else:
+            perm = np.array(
+                sorted(range(n), key=lambda r: self._rows[r][column], reverse=descending), dtype=np.intp
+            )
+        self.layoutAboutToBeChanged.emit()
+        old_persistent = self.persistentIndexList()
+        new_pos = np.empty(n, dtype=np.intp)
+        new_pos[perm] = np.arange(n)
+        order_list = perm.tolist()
+        self._flips = [self._flips[i] for i in order_list]
+        self._rows = [self._rows[i] for i in order_list]
+        self._keys = self._keys[perm]
+        self.changePersistentIndexList(
+            old_persistent,
+            [self.index(int(new_pos[i.row()]), i.column()) for i in old_persistent],
+        )
+        self.layoutChanged.emit()
 
-class SortableTableWidgetItem(QTableWidgetItem):
-    """Table item that sorts by Qt.UserRole if available."""
+    def refresh_icon(self, item_id: str, quality: int) -> None:
+        """Repaint the item cells of rows showing ``(item_id, quality)``."""
+        key = (item_id, quality)
+        rows = [r for r, flip in enumerate(self._flips) if self._icon_key(flip) == key]
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), 0), [Qt.DecorationRole])
 
-    def __lt__(self, other):  # type: ignore[override]
-        if isinstance(other, QTableWidgetItem):
-            sd = self.data(Qt.UserRole)
-            od = other.data(Qt.UserRole)
-            if sd is not None and od is not None:
-                return sd < od
-        return super().__lt__(other)
 
+class FlipFinderWorker(QObject):
+    """Background worker for computing flip opportunities.
 
-class FlipFinderWorker(QThread):
-    """Background worker for computing flip opportunities."""
+    Runs on ``QThreadPool.globalInstance()`` via :class:`WorkerRunnable`.
+    """
 
     finished = Signal(dict)
     error = Signal(str)
     progress = Signal(int, str)
+    partial = Signal(list)
 
     def __init__(self, params: Dict[str, Any]):
         super().__init__()
@@ -58,27 +265,7 @@ class FlipFinderWorker(QThread):
         try:
             self.progress.emit(10, "Preparing data...")
             rows = STORE.latest_rows()
-            trimmed = []
-
-            def _num(row, *keys, default=0):
-                for k in keys:
-                    if k in row and row[k] is not None:
-                        try:
-                            return float(row[k])
-                        except Exception:
-                            pass
-                return float(default)
-
-            for r in rows:
-                buy_val = _num(r, "buy_price_max", "buy_max", "BuyMax", default=0)
-                sell_val = _num(r, "sell_price_min", "sell_min", "SellMin", default=0)
-                if buy_val > 0 or sell_val > 0:
-                    row_norm = dict(r)
-                    row_norm["buy_price_max"] = buy_val
-                    row_norm["sell_price_min"] = sell_val
-                    row_norm["buy"] = buy_val
-                    row_norm["sell"] = sell_val
-                    trimmed.append(row_norm)
+            trimmed = _normalize_price_rows(rows)
 
             self.log.debug(
                 "FlipFinder trimmed rows: %s (examples: %s)",
@@ -88,7 +275,11 @@ class FlipFinderWorker(QThread):
             self.progress.emit(50, "Computing...")
             src_cities = set(self.params.get("src_cities") or self.params.get("cities") or [])
             dst_cities = set(self.params.get("dst_cities") or self.params.get("cities") or [])
-            parsed_items = self.params.get("items")
+            # Item text is parsed here rather than in the click handler
+            if "items" in self.params:
+                parsed_items = self.params["items"]
+            else:
+                parsed_items = parse_item_input(self.params.get("items_raw"))
             ui_min_profit = int(self.params.get("min_profit", 0))
             ui_min_roi_pct = float(self.params.get("min_roi", 0.0))
             min_roi_decimal = ui_min_roi_pct / 100.0
@@ -105,9 +296,29 @@ class FlipFinderWorker(QThread):
             tag = tiers[-1]["tag"]
             all_stats = []
             stats = {}
+            # Filter columns are built once; each tier narrows the rows with masks
+            columns = price_columns(trimmed)
+            tried: Dict[tuple, dict] = {}
             for tier in tiers:
+                # With no item list the relaxed tiers can repeat an earlier
+                # spec exactly; such a tier cannot find anything new
+                items = tier["items"]
+                spec = (frozenset(items) if items else None, tier["min_profit"], tier["min_roi"], tier["max_age"])
+                if spec in tried:
+                    stats = tried[spec]
+                    all_stats.append((tier["tag"], stats, 0))
+                    continue
+                tier_rows, dropped = prefilter_rows(
+                    trimmed,
+                    columns,
+                    items_filter=tier["items"],
+                    src_cities=src_cities,
+                    dst_cities=dst_cities,
+                    qualities=self.params.get("qualities"),
+                    max_age_hours=tier["max_age"],
+                )
                 flips, stats = build_flips(
-                    rows=trimmed,
+                    rows=tier_rows,
                     items_filter=tier["items"],
                     src_cities=src_cities,
                     dst_cities=dst_cities,
@@ -117,14 +328,25 @@ class FlipFinderWorker(QThread):
                     max_age_hours=tier["max_age"],
                     max_results=self.params.get("max_results", 100),
                 )
+                stats.update(dropped)
+                tried[spec] = stats
                 if flips:
                     tag = tier["tag"]
                     all_stats.append((tier["tag"], stats, len(flips)))
                     break
                 all_stats.append((tier["tag"], stats, 0))
 
+            # Identical to what the table already shows: nothing to stream
+            signature = _results_signature(flips)
+            unchanged = signature == self.params.get("previous_signature")
+            if not unchanged:
+                for i in range(0, len(flips), PARTIAL_CHUNK):
+                    self.partial.emit(flips[i:i + PARTIAL_CHUNK])
             self.progress.emit(100, "Done")
-            self.finished.emit({"flips": flips, "tag": tag, "stats": stats, "all_stats": all_stats})
+            self.finished.emit({
+                "flips": flips, "tag": tag, "stats": stats, "all_stats": all_stats,
+                "signature": signature, "unchanged": unchanged,
+            })
         except Exception as e:
             self.log.exception("Flip search failed: %r", e)
             self.error.emit(str(e))
@@ -142,7 +364,20 @@ class FlipFinderWidget(QWidget):
         
         # Worker and data
         self.worker = None
-        self._pending = False
+        self._search_running = False
+        self._streamed_rows = 0
+        self._results_signature = None
+        # Icons are fetched on their own small pool so downloads never queue
+        # behind (or hold up) searches on the global pool
+        self._icon_pool = QThreadPool(self)
+        self._icon_pool.setMaxThreadCount(4)
+        self._icons: Dict[Tuple[str, int], Optional[QIcon]] = {}
+        self._icon_workers: Dict[Tuple[str, int], IconFetchWorker] = {}
+        # Coalesce bursts of search requests (button, quick search, refresh)
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(200)
+        self._search_debounce.timeout.connect(self._run_search)
         self.current_flips: List[Dict[str, Any]] = []
 
         self.init_ui()
@@ -229,7 +464,8 @@ class FlipFinderWidget(QWidget):
         # Quality filter
         params_layout.addWidget(QLabel("Quality:"), row, 0)
         self.quality_combo = QComboBox()
-        self.quality_combo.addItems(["Normal (1)", "Good (2)", "Outstanding (3)", "Excellent (4)", "Masterpiece (5)", "All"])
+        for text, quality in QUALITY_CHOICES:
+            self.quality_combo.addItem(text, quality)
         params_layout.addWidget(self.quality_combo, row, 1)
         row += 1
         
@@ -315,13 +551,11 @@ class FlipFinderWidget(QWidget):
         results_layout.addLayout(results_header)
         
         # Results table
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(7)
+        self.results_model = FlipsTableModel(self._icon_for, self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         self.results_table.setIconSize(QSize(24, 24))
         self.results_table.verticalHeader().setDefaultSectionSize(28)
-        self.results_table.setHorizontalHeaderLabels([
-            "Item", "Route", "Buy", "Sell", "Spread", "ROI %", "Updated"
-        ])
         
         # Configure table
         header = self.results_table.horizontalHeader()
@@ -332,7 +566,7 @@ class FlipFinderWidget(QWidget):
         self.results_table.setSortingEnabled(True)
         
         # Connect selection change
-        self.results_table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.results_table.selectionModel().selectionChanged.connect(self.on_selection_changed)
         
         results_layout.addWidget(self.results_table)
         
@@ -390,18 +624,23 @@ class FlipFinderWidget(QWidget):
         self.search_opportunities()
 
     def search_opportunities(self):
-        """Search for flip opportunities."""
-        if self.worker and self.worker.isRunning():
-            self._pending = True
-            self.logger.info("Search queued while another is running")
+        """Search for flip opportunities (debounced)."""
+        self._search_debounce.start()
+
+    def _run_search(self):
+        if self._search_running:
+            # Try again once the running search has had time to finish
+            self._search_debounce.start()
             return
 
         params = self.get_search_parameters()
+        params['previous_signature'] = self._results_signature
 
         self.worker = FlipFinderWorker(params)
         self.worker.finished.connect(self.on_flips_found)
         self.worker.error.connect(self.on_search_error)
         self.worker.progress.connect(self.on_progress_updated)
+        self.worker.partial.connect(self.on_partial_flips)
 
         self.search_btn.setEnabled(False)
         self.progress_bar.setVisible(True)
@@ -409,26 +648,25 @@ class FlipFinderWidget(QWidget):
         self.progress_bar.setValue(0)
         self.set_status("Searching...")
 
-        self.worker.start()
+        self._search_running = True
+        self._streamed_rows = 0
+        QThreadPool.globalInstance().start(WorkerRunnable(self.worker))
     
     def get_search_parameters(self) -> Dict[str, Any]:
         """Get search parameters from UI."""
         params = {}
 
-        # Items
-        params['items'] = parse_item_input(self.items_edit.text())
+        # Items - raw text only; FlipFinderWorker.run parses it off the GUI thread
+        params['items_raw'] = self.items_edit.text()
 
-        # Cities - same set for src and dst
+        # Cities - same set for src and dst; the worker only reads these
         cities_selection = self.cities_combo.currentText()
-        all_cities = ["Martlock", "Lymhurst", "Bridgewatch", "Fort Sterling", "Thetford", "Caerleon"]
-        cities_set = parse_city_selection(cities_selection, all_cities)
-        params['cities'] = list(cities_set)
-        params['src_cities'] = list(cities_set)
-        params['dst_cities'] = list(cities_set)
+        cities = list(parse_city_selection(cities_selection, ALL_CITIES))
+        params['cities'] = params['src_cities'] = params['dst_cities'] = cities
 
         # Quality
-        quality_text = self.quality_combo.currentText()
-        params['qualities'] = parse_quality_input(quality_text)
+        quality = self.quality_combo.currentData()
+        params['qualities'] = list(ALL_QUALITIES) if quality is None else [quality]
 
         # Filters
         params['min_profit'] = self.min_profit_spin.value()
@@ -440,20 +678,32 @@ class FlipFinderWidget(QWidget):
     
     def on_flips_found(self, payload: Dict[str, Any]):
         """Handle search results."""
+        self._search_running = False
         flips = payload.get("flips", [])
         self.current_flips = flips
-        self.populate_results_table(flips)
+        if payload.get("unchanged") and self.results_model.rowCount() == len(flips):
+            pass  # the table already shows exactly these results
+        elif self._streamed_rows == len(flips) and flips:
+            # Rows already arrived through on_partial_flips; only sort them
+            self.results_table.sortByColumn(5, Qt.DescendingOrder)
+        else:
+            self.populate_results_table(flips)
+        self._streamed_rows = 0
+        self._results_signature = payload.get("signature")
 
         self.results_label.setText(f"Found {len(flips)} opportunities")
         self.set_status(f"Search complete: {len(flips)} opportunities found")
 
         self.search_btn.setEnabled(True)
         self.progress_bar.setVisible(False)
-
-        if self._pending:
-            self._pending = False
-            self.search_opportunities()
     
+    def on_partial_flips(self, chunk: List[Dict[str, Any]]):
+        """Append a chunk of streamed results to the table."""
+        if not self._streamed_rows:
+            self.results_model.setRows([])
+        self.results_model.appendRows(chunk)
+        self._streamed_rows += len(chunk)
+
     def on_progress_updated(self, progress: int, message: str):
         """Handle progress updates."""
         self.progress_bar.setValue(progress)
@@ -461,77 +711,53 @@ class FlipFinderWidget(QWidget):
     
     def on_search_error(self, error_message: str):
         """Handle search errors."""
+        self._search_running = False
         self.logger.error(f"Search error: {error_message}")
         self.set_status(f"Search failed: {error_message}")
 
         # Reset UI
+        self._streamed_rows = 0
         self.search_btn.setEnabled(True)
         self.progress_bar.setVisible(False)
-        self._pending = False
     
     def populate_results_table(self, flips: List[Dict[str, Any]]):
-        """Populate results table with flip data."""
-        self.results_table.setRowCount(len(flips))
-
-        for row, flip in enumerate(flips):
-            item_id = flip.get("item_id") or flip.get("item") or ""
-            quality = flip.get("quality")
-            item_text = flip.get("item_name") or item_id or "—"
-            item_cell = QTableWidgetItem(item_text)
-            item_cell.setData(Qt.UserRole, flip)
-            self.results_table.setItem(row, 0, item_cell)
-
-            def _apply_icon(icon, cell=item_cell):
-                cell.setIcon(icon)
-
-            data = fetch_icon_bytes(item_id, quality or 1)
-            if data:
-                pm = QPixmap()
-                pm.loadFromData(data)
-                if not pm.isNull():
-                    _apply_icon(QIcon(pm))
+        """Populate results table with flip data, sorted by ROI."""
+        self.results_model.setRows(flips)
+        self.results_table.sortByColumn(5, Qt.DescendingOrder)
+
+    def _icon_for(self, item_id: str, quality: int) -> Optional[QIcon]:
+        """Return the cached icon, starting a background fetch on first use."""
+        key = (item_id, quality)
+        if key in self._icons:
+            return self._icons[key]
+        if item_id and key not in self._icon_workers:
+            worker = IconFetchWorker(item_id, quality, fetch_icon_bytes)
+            worker.finished.connect(self._on_icon_fetched)
+            self._icon_workers[key] = worker
+            self._icon_pool.start(WorkerRunnable(worker))
+        return None
+
+    def _on_icon_fetched(self, item_id: str, quality: int, data):
+        """Decode fetched icon bytes and repaint the rows showing that item."""
+        key = (item_id, quality)
+        self._icon_workers.pop(key, None)
+        icon = None
+        if data:
+            pm = QPixmap()
+            pm.loadFromData(data)
+            if not pm.isNull():
+                icon = QIcon(pm)
+        # A failed fetch is remembered as None so it is not retried every fill
+        self._icons[key] = icon
+        if icon is not None:
+            self.results_model.refresh_icon(item_id, quality)
 
-            route_str = f"{flip['buy_city']} → {flip['sell_city']}"
-            flip.setdefault("route", route_str)
-            route_item = QTableWidgetItem(route_str)
-            self.results_table.setItem(row, 1, route_item)
-
-            buy_item = QTableWidgetItem(f"{flip['buy']:,}")
-            buy_item.setData(Qt.EditRole, flip['buy'])
-            self.results_table.setItem(row, 2, buy_item)
-
-            sell_item = QTableWidgetItem(f"{flip['sell']:,}")
-            sell_item.setData(Qt.EditRole, flip['sell'])
-            self.results_table.setItem(row, 3, sell_item)
-
-            spread_item = QTableWidgetItem(f"{flip['spread']:,}")
-            spread_item.setData(Qt.EditRole, flip['spread'])
-            self.results_table.setItem(row, 4, spread_item)
-
-            roi_item = QTableWidgetItem(f"{flip['roi_pct']:.1f}%")
-            roi_item.setData(Qt.EditRole, flip['roi_pct'])
-            self.results_table.setItem(row, 5, roi_item)
-
-            udisp = flip.get("updated") or ""
-            udt = flip.get("updated_dt")
-            if not udisp and isinstance(udt, (datetime, pd.Timestamp)):
-                if isinstance(udt, pd.Timestamp):
-                    udt = udt.to_pydatetime()
-                udisp = rel_age(udt)
-            updated_item = SortableTableWidgetItem(str(udisp))
-            if isinstance(udt, datetime):
-                updated_item.setData(Qt.UserRole, int(udt.timestamp()))
-            self.results_table.setItem(row, 6, updated_item)
-
-        self.results_table.sortItems(5, Qt.DescendingOrder)
-    
     def on_selection_changed(self):
         """Handle table selection change."""
-        selected_rows = {item.row() for item in self.results_table.selectedItems()}
+        selected_rows = self.results_table.selectionModel().selectedRows()
         if selected_rows:
-            row = min(selected_rows)
-            if 0 <= row < len(self.current_flips):
-                self.show_opportunity_details(self.current_flips[row])
+            row = min(index.row() for index in selected_rows)
+            self.show_opportunity_details(self.results_model.flip(row))
         else:
             self.details_text.setPlainText("Select an opportunity to view details.")
 
@@ -555,7 +781,8 @@ class FlipFinderWidget(QWidget):
     def clear_results(self):
         """Clear search results."""
         self.current_flips = []
-        self.results_table.setRowCount(0)
+        self._results_signature = None
+        self.results_model.setRows([])
         self.results_label.setText("No search performed")
         self.details_text.setPlainText("Select an opportunity to view details.")
         self.set_status("Results cleared")
@@ -577,6 +804,7 @@ class FlipFinderWidget(QWidget):
     def set_opportunities(self, flips: List[Dict[str, Any]]):
         """Set opportunities from external source (e.g., dashboard)."""
         self.current_flips = flips
+        self._results_signature = None
         self.populate_results_table(flips)
         self.results_label.setText(f"Showing {len(flips)} opportunities")
     
@@ -4,13 +4,17 @@ from __future__ import annotations
 
 import os
 import pathlib
+import time
 from functools import lru_cache
 
-import requests
 from PySide6.QtGui import QIcon
 
+from datasources.http import get_shared_session
 from utils.constants import ICON_BASE
 
+# Icons on disk older than this are revalidated with the server's ETag
+ICON_MAX_AGE = 7 * 24 * 3600.0
+
 
 def _cache_dir() -> pathlib.Path:
     base = pathlib.Path(os.path.expanduser("~"))
@@ -19,28 +23,58 @@ def _cache_dir() -> pathlib.Path:
     return cache
 
 
-@lru_cache(maxsize=512)
+def _refresh_icon_file(url: str, fname: pathlib.Path) -> None:
+    """Download ``url`` to ``fname`` unless the cached copy is still current.
+
+    A fresh file is used as is. A stale one is revalidated with
+    ``If-None-Match`` so an unchanged icon costs a 304 and no body.
+    """
+
+    etag_file = fname.with_suffix(".etag")
+    headers = {}
+    if fname.exists():
+        if time.time() - fname.stat().st_mtime < ICON_MAX_AGE:
+            return
+        if etag_file.exists():
+            headers["If-None-Match"] = etag_file.read_text(encoding="utf-8").strip()
+    # Pooled keep-alive session: one TLS handshake serves many icons
+    resp = get_shared_session().get(url, timeout=5, headers=headers)
+    if resp.status_code == 304 and fname.exists():
+        os.utime(fname)
+    elif resp.status_code == 200:
+        fname.write_bytes(resp.content)
+        etag = resp.headers.get("ETag")
+        if etag:
+            etag_file.write_text(etag, encoding="utf-8")
+
+
+@lru_cache(maxsize=4096)
+def _get_icon_cached(item_id: str, quality: int) -> QIcon:
+    url = ICON_BASE.format(id=item_id)
+    url = f"{url}?quality={quality}"
+    fname = _cache_dir() / f"{item_id}_{quality}.png"
+    try:
+        _refresh_icon_file(url, fname)
+    except Exception:  # pragma: no cover - network errors ignored
+        if not fname.exists():
+            return QIcon()
+    if not fname.exists():
+        return QIcon()
+    return QIcon(str(fname))
+
+
 def get_icon(item_dict: dict) -> QIcon:
     """Return a QIcon for ``item_dict``.
 
     This is a simplified helper used in tests; icons are cached on disk to
-    avoid repeated downloads.  If the download fails, an empty icon is
+    avoid repeated downloads and the decoded ``QIcon`` is memoised per
+    ``(item_id, quality)``.  If the download fails, an empty icon is
     returned.
     """
 
     item_id = item_dict.get("item_id") or ""
     quality = int(item_dict.get("quality") or 1)
-    url = ICON_BASE.format(id=item_id)
-    url = f"{url}?quality={quality}"
-    fname = _cache_dir() / f"{item_id}_{quality}.png"
-    if not fname.exists():
-        try:
-            resp = requests.get(url, timeout=5)
-            if resp.status_code == 200:
-                fname.write_bytes(resp.content)
-        except Exception:  # pragma: no cover - network errors ignored
-            return QIcon()
-    return QIcon(str(fname))
+    return _get_icon_cached(item_id, quality)
 
 
 __all__ = ["get_icon"]
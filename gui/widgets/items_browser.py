@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import numpy as np
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, QSize
 from PySide6.QtGui import QIcon, QPixmap
 from services.item_icons import fetch_icon_bytes
@@ -80,6 +81,10 @@ class ItemsBrowser(QWidget):
         super().__init__(parent)
         self.main_window = parent
         self.rows_all: list[dict] = []
+        # Filter columns of rows_all, rebuilt whenever the rows change
+        self._item_col = np.array([], dtype=str)
+        self._city_col = np.array([], dtype=object)
+        self._qual_col = np.array([], dtype=np.int64)
         self.rows_filtered: list[dict] = []
         self.page = 1
         self.page_size = 100
@@ -135,6 +140,12 @@ class ItemsBrowser(QWidget):
     # --- data flow ---
     def on_rows_updated(self, rows: list[dict]):
         self.rows_all = rows or []
+        n = len(self.rows_all)
+        self._item_col = np.array([r.get("item_id") or "" for r in self.rows_all], dtype=str)
+        self._city_col = np.array([r.get("city") for r in self.rows_all], dtype=object)
+        self._qual_col = np.fromiter(
+            (int(r.get("quality") or 0) for r in self.rows_all), dtype=np.int64, count=n
+        )
         self.page = 1
         self._apply_filters()
 
@@ -144,18 +155,24 @@ class ItemsBrowser(QWidget):
         city = self.cboCity.currentText()
         qual = self.cboQual.currentText()
 
-        rf = self.rows_all
+        # One boolean mask over the column arrays instead of a list pass per filter
+        mask = None
         if text:
-            rf = [r for r in rf if text in (r.get("item_id","" ) or "")]
+            mask = np.char.find(self._item_col, text) >= 0
         if city and city != "All Cities":
-            rf = [r for r in rf if r.get("city") == city]
+            m = self._city_col == city
+            mask = m if mask is None else mask & m
         if qual and qual != "All":
             try:
-                qn = int(qual)
-                rf = [r for r in rf if int(r.get("quality") or 0) == qn]
-            except:
+                m = self._qual_col == int(qual)
+                mask = m if mask is None else mask & m
+            except ValueError:
                 pass
 
+        rf = self.rows_all
+        if mask is not None:
+            rf = [rf[i] for i in np.flatnonzero(mask).tolist()]
+
         self.rows_filtered = rf
         # recompute pages
         total_pages = max(1, (len(self.rows_filtered) + self.page_size - 1) // self.page_size)
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Optional
 
-from PySide6.QtCore import Qt, QThread, QSize
+from PySide6.QtCore import Qt, QThreadPool, QSize, QTimer
 from PySide6.QtGui import QIcon, QPixmap
 from services.item_icons import fetch_icon_bytes
 from PySide6.QtWidgets import (
@@ -36,6 +37,12 @@ class MarketPricesWidget(QWidget):
         self.rows: List[Dict[str, Any]] = []
         self.refresh_running = False
         self.refresh_pending = False
+        # time.monotonic() of the last refresh start, for freshness checks
+        self.last_refresh_started: Optional[float] = None
+        # Polls the running worker's progress queue instead of per-update signals
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._poll_refresh_progress)
         self.init_ui()
 
     # ------------------------------------------------------------------
@@ -206,32 +213,35 @@ class MarketPricesWidget(QWidget):
             )
             return
         self.refresh_running = True
+        self.last_refresh_started = time.monotonic()
         self.refresh_btn.setEnabled(False)
         self.main_window.set_refresh_enabled(False)
         params = self.collect_refresh_params()
         self.logger.info("Market refresh requested: %s", params)
 
-        from gui.threads import RefreshWorker
+        from gui.threads import RefreshWorker, WorkerRunnable
 
-        self._thread = QThread(self)
         # Pass application settings so the worker can honour fetch_all_items
         self._worker = RefreshWorker(params, settings=self.main_window.get_config())
-        self._worker.moveToThread(self._thread)
-        self._thread.started.connect(self._worker.run)
-        self._worker.progress.connect(self.on_refresh_progress)
         self._worker.finished.connect(self.on_refresh_done)
         self._worker.error.connect(self.on_refresh_error)
-        self._worker.finished.connect(self._thread.quit)
-        self._worker.finished.connect(self._worker.deleteLater)
-        self._thread.finished.connect(self._thread.deleteLater)
-        self._thread.start()
+        QThreadPool.globalInstance().start(WorkerRunnable(self._worker))
+        self._progress_timer.start()
 
     def on_refresh_progress(self, pct: int, msg: str) -> None:
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(pct)
         self.progress_label.setText(msg)
+        self.main_window.set_status(msg)
+
+    def _poll_refresh_progress(self) -> None:
+        worker = getattr(self, "_worker", None)
+        update = worker.drain_progress() if worker is not None else None
+        if update is not None:
+            self.on_refresh_progress(*update)
 
     def _refresh_cleanup(self) -> None:
+        self._progress_timer.stop()
         self.refresh_running = False
         self.refresh_btn.setEnabled(True)
         self.main_window.set_refresh_enabled(True)
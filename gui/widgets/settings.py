@@ -18,6 +18,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
+from core.signals import signals
 from utils.pecheck import is_valid_win64_exe
 
 
@@ -468,6 +469,7 @@ class SettingsWidget(QWidget):
             self.config = config
             self.main_window.config = config
             self.modified = False
+            signals.config_changed.emit(config)
 
             self.set_status("Settings saved successfully")
 
@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 from collections import defaultdict
+import heapq
 import logging
 import time
 from datetime import datetime
 from typing import Dict, Iterable, List, Optional, Sequence, Set
 
+import numpy as np
+import pandas as pd
+
 from utils.constants import MAX_DATA_AGE_HOURS
 
 log = logging.getLogger(__name__)
@@ -119,8 +123,85 @@ def build_flips(
 
     flips = list(dedupe.values())
     stats["kept"] = len(flips)
-    flips.sort(key=lambda r: (r["roi"], r["spread"]), reverse=True)
-    return flips[: int(max_results)], dict(stats)
+    rank = lambda r: (r["roi"], r["spread"])
+    limit = int(max_results)
+    if len(flips) > limit:
+        # Only the top ``limit`` are kept; a bounded heap avoids sorting the rest
+        return heapq.nlargest(limit, flips, key=rank), dict(stats)
+    flips.sort(key=rank, reverse=True)
+    return flips, dict(stats)
+
+
+def price_columns(rows: Sequence[Dict]) -> Dict[str, np.ndarray]:
+    """Column arrays of the row fields :func:`build_flips` filters on.
+
+    Item ids and cities are factorized to integer codes so repeated passes
+    over the same rows (e.g. relaxed search tiers) can filter with masks.
+    """
+
+    n = len(rows)
+    item_codes, item_uniques = pd.factorize(pd.Series([r.get("item_id") for r in rows], dtype=object))
+    city_codes, city_uniques = pd.factorize(pd.Series([r.get("city") for r in rows], dtype=object))
+    # Narrow dtypes keep the per-tier masks cheap; update times stay float64
+    # because epoch hours lose minutes of precision in float32
+    return {
+        "item_codes": item_codes.astype(np.int32),
+        "item_uniques": np.asarray(item_uniques, dtype=object),
+        "city_codes": city_codes.astype(np.int16),
+        "city_uniques": np.asarray(city_uniques, dtype=object),
+        "quality": np.fromiter((int(r.get("quality") or 1) for r in rows), dtype=np.int16, count=n),
+        "updated": np.fromiter((float(r.get("updated_epoch_hours") or 0.0) for r in rows), dtype=np.float64, count=n),
+    }
+
+
+def _codes_in(codes: np.ndarray, uniques: np.ndarray, allowed: Iterable) -> np.ndarray:
+    allowed_set = set(allowed)
+    wanted = [i for i, value in enumerate(uniques.tolist()) if value in allowed_set]
+    return np.isin(codes, wanted)
+
+
+def prefilter_rows(
+    rows: Sequence[Dict],
+    columns: Dict[str, np.ndarray],
+    *,
+    items_filter: Optional[Set[str]],
+    src_cities: Iterable[str],
+    dst_cities: Iterable[str],
+    qualities: Iterable[int] | None,
+    max_age_hours: int,
+) -> tuple[list[dict], dict[str, int]]:
+    """Drop rows :func:`build_flips` would skip, using ``price_columns`` masks.
+
+    Returns the surviving rows and the per-row drop statistics build_flips
+    would have recorded for the rows removed here.
+    """
+
+    n = len(rows)
+    now_hours = time.time() / 3600.0
+    if items_filter:
+        item_ok = _codes_in(columns["item_codes"], columns["item_uniques"], items_filter)
+    else:
+        item_ok = np.ones(n, dtype=bool)
+    cities = set(src_cities or []) | set(dst_cities or [])
+    city_ok = _codes_in(columns["city_codes"], columns["city_uniques"], cities)
+    qual_set = set(qualities or [])
+    qual_ok = np.isin(columns["quality"], list(qual_set)) if qual_set else np.ones(n, dtype=bool)
+    updated = columns["updated"]
+    if max_age_hours > 0:
+        fresh = (updated > 0) & ((now_hours - updated) <= max_age_hours)
+    else:
+        fresh = np.ones(n, dtype=bool)
+
+    # Same precedence as build_flips: items, then city, then quality, then age
+    listed = item_ok & city_ok & qual_ok
+    counts = {
+        "seen_rows": n,
+        "not_in_items": int(np.count_nonzero(~item_ok)),
+        "bad_city": int(np.count_nonzero(item_ok & ~city_ok)),
+        "stale": int(np.count_nonzero(listed & ~fresh)),
+    }
+    kept = np.flatnonzero(listed & fresh)
+    return [rows[i] for i in kept.tolist()], {k: v for k, v in counts.items() if v}
 
 
 def compute_flips(
@@ -165,5 +246,5 @@ def compute_flips(
 
 compute_flips_py = compute_flips
 
-__all__ = ["build_flips", "compute_flips", "compute_flips_py"]
+__all__ = ["build_flips", "compute_flips", "compute_flips_py", "price_columns", "prefilter_rows"]
 
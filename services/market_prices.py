@@ -17,7 +17,7 @@ from datasources.http import get_shared_session
 from datasources.aodp_url import base_for, build_prices_request, DEFAULT_CITIES
 from utils.params import qualities_to_csv, cities_to_list
 from utils.items import parse_items, items_catalog_codes
-from utils.timefmt import to_utc, now_utc_iso, rel_age
+from utils.timefmt import to_utc, now_utc_iso, fmt_age
 from utils.constants import MAX_DATA_AGE_HOURS
 from core.signals import signals
 from services.netlimit import bucket
@@ -37,6 +37,7 @@ class MarketPriceStore:
         self._latest_rows: list[dict] = []
         self._raw_df: pd.DataFrame | None = None
         self._agg_df: pd.DataFrame | None = None
+        self._last_summary: dict | None = None
         self._conc = 4
         self._last429 = 0
         self.max_concurrency = MAX_CONC
@@ -45,6 +46,11 @@ class MarketPriceStore:
         with self._lock:
             return list(self._latest_rows)
 
+    def last_summary(self) -> dict | None:
+        """Most recent summary emitted on ``market_data_ready``, if any."""
+        with self._lock:
+            return self._last_summary
+
     def _on_result(self, status_code: int) -> None:
         if status_code == 429:
             self._last429 += 1
@@ -116,9 +122,25 @@ class MarketPriceStore:
         bucket.tokens = bucket.capacity
 
         chunks = list(chunk_by_url(items, base, cities, quals_list))
-        max_workers = self.current_concurrency()
+        # Size the pool for the ceiling and let the adaptive concurrency decide
+        # how many requests are actually in flight, so it can grow mid-refresh
+        max_workers = self.max_concurrency
+        inflight = threading.Condition()
+        active = 0
         results: List[Dict] = []
 
+        def send(url, params):
+            nonlocal active
+            with inflight:
+                inflight.wait_for(lambda: active < self.current_concurrency())
+                active += 1
+            try:
+                return sess.get(url, params=params, timeout=(5, 10))
+            finally:
+                with inflight:
+                    active -= 1
+                    inflight.notify_all()
+
         def pull(chunk, attempt=1):
             url, params = build_prices_request(base, chunk, cities, quals_csv)
             full_url = requests.Request("GET", url, params=params).prepare().url
@@ -133,9 +155,11 @@ class MarketPriceStore:
                 status = 200
                 r = None
             else:
+                if cancel and cancel():
+                    return []
                 bucket.acquire()
                 try:
-                    r = sess.get(url, params=params, timeout=(5, 10))
+                    r = send(url, params)
                 except (rqexc.Timeout, rqexc.ConnectionError) as e:
                     log.warning("Network error on %s: %s", full_url, e)
                     return []
@@ -228,13 +252,16 @@ class MarketPriceStore:
             self._agg_df = self._raw_df  # already aggregated by normalization
             self._latest_rows = norm_rows
         signals.market_rows_updated.emit(self.latest_rows())
-        emit_summary(self._agg_df)
+        summary = emit_summary(self._agg_df)
+        with self._lock:
+            self._last_summary = summary
 
     def clear(self):
         with self._lock:
             self._latest_rows.clear()
             self._raw_df = None
             self._agg_df = None
+            self._last_summary = None
             self._conc = 4
             self._last429 = 0
 
@@ -329,11 +356,21 @@ def normalize_and_dedupe(rows: List[Dict]) -> List[Dict]:
     ``MAX_DATA_AGE_HOURS`` are discarded.
     """
 
-    cutoff = None
+    from datetime import datetime, timezone
+
+    # Ages and the freshness cutoff are plain epoch-second arithmetic against
+    # a single reference time instead of per-row datetime/timedelta objects.
+    now = datetime.now(timezone.utc)
+    now_ts = now.timestamp()
+    cutoff_ts = None
     if MAX_DATA_AGE_HOURS and MAX_DATA_AGE_HOURS > 0:
-        from datetime import datetime, timezone, timedelta
+        cutoff_ts = now_ts - MAX_DATA_AGE_HOURS * 3600
 
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=MAX_DATA_AGE_HOURS)
+    def ts(d):
+        try:
+            return to_utc(d)
+        except Exception:  # pragma: no cover - defensive
+            return None
 
     out: Dict[tuple, Dict] = {}
     for row in rows:
@@ -345,20 +382,14 @@ def normalize_and_dedupe(rows: List[Dict]) -> List[Dict]:
         buy = int(row.get("buy_price_max") or 0)
         sell = int(row.get("sell_price_min") or 0)
 
-        def ts(d):
-            try:
-                return to_utc(d)
-            except Exception:  # pragma: no cover - defensive
-                return None
-
         sell_dt = ts(row.get("sell_price_min_date"))
         buy_dt = ts(row.get("buy_price_max_date"))
-        from datetime import datetime, timezone
         updated_dt = max(
             [d for d in (sell_dt, buy_dt) if d is not None],
-            default=datetime.now(timezone.utc),
+            default=now,
         )
-        if cutoff and updated_dt < cutoff:
+        updated_ts = updated_dt.timestamp()
+        if cutoff_ts is not None and updated_ts < cutoff_ts:
             continue
 
         prev = out.get(key)
@@ -371,14 +402,16 @@ def normalize_and_dedupe(rows: List[Dict]) -> List[Dict]:
                 "buy_price_max": buy,
                 "sell_price_min": sell if sell > 0 else 0,
                 "updated_dt": updated_dt,
+                "_updated_ts": updated_ts,
             }
         else:
             prev["buy_price_max"] = max(prev["buy_price_max"], buy)
             if sell > 0:
                 prev_sell = prev.get("sell_price_min") or 0
                 prev["sell_price_min"] = min(prev_sell or sell, sell) if prev_sell else sell
-            if updated_dt and (prev.get("updated_dt") is None or updated_dt > prev["updated_dt"]):
+            if updated_ts > prev["_updated_ts"]:
                 prev["updated_dt"] = updated_dt
+                prev["_updated_ts"] = updated_ts
 
     normalized: List[Dict] = []
     for rec in out.values():
@@ -388,20 +421,17 @@ def normalize_and_dedupe(rows: List[Dict]) -> List[Dict]:
         if spread < 0:
             spread = 0
         roi = 100.0 * spread / max(1, buy)
-        udt = rec.get("updated_dt")
+        udt = rec["updated_dt"]
+        uts = rec.pop("_updated_ts")
         rec.update(
             {
                 "spread": spread,
                 "roi_pct": roi,
-                "updated_human": rel_age(udt) if udt else "",
+                "updated_human": fmt_age(int(now_ts - uts)),
+                "updated_iso": udt.isoformat(),
+                "updated_epoch_hours": uts / 3600.0,
             }
         )
-        if udt:
-            rec["updated_iso"] = udt.isoformat()
-            rec["updated_epoch_hours"] = udt.timestamp() / 3600.0
-        else:
-            rec["updated_iso"] = None
-            rec["updated_epoch_hours"] = 0.0
         normalized.append(rec)
 
     return normalized
@@ -440,31 +470,42 @@ def top_opportunities(df: pd.DataFrame, limit: int = 20) -> list[dict]:
     if df.empty:
         return []
     cands = df[(df["buy_price_max"] > 0) & (df["sell_price_min"] > 0) & (df["spread"] > 0)]
-    cands = cands.sort_values(["roi_pct", "spread"], ascending=[False, False]).head(limit)
-    out = []
-    for r in cands.itertuples(index=False):
-        out.append(
-            {
-                "item": r.item_id,
-                "buy_city": r.city,
-                "sell_city": r.city,
-                "buy_price": int(r.buy_price_max),
-                "sell_price": int(r.sell_price_min),
-                "spread": int(r.spread),
-                "roi_pct": float(r.roi_pct),
-                "updated_dt": r.updated_dt,
-            }
-        )
-    return out
-
-
-def emit_summary(df: pd.DataFrame):
+    # Partial selection instead of sorting every candidate for the first few
+    cands = cands.nlargest(limit, ["roi_pct", "spread"])
+    # Pull each column out once and zip them, rather than building a row
+    # object per candidate; tolist() also yields plain Python scalars.
+    cols = zip(
+        cands["item_id"].tolist(),
+        cands["city"].tolist(),
+        cands["buy_price_max"].tolist(),
+        cands["sell_price_min"].tolist(),
+        cands["spread"].tolist(),
+        cands["roi_pct"].tolist(),
+        cands["updated_dt"].tolist(),
+    )
+    return [
+        {
+            "item": item,
+            "buy_city": city,
+            "sell_city": city,
+            "buy_price": int(buy),
+            "sell_price": int(sell),
+            "spread": int(spread),
+            "roi_pct": float(roi),
+            "updated_dt": updated,
+        }
+        for item, city, buy, sell, spread, roi, updated in cols
+    ]
+
+
+def emit_summary(df: pd.DataFrame) -> dict:
     summary = {
         "last_update_utc": now_utc_iso(),
         "records": int(len(df)),
         "top_opportunities": top_opportunities(df, 20),
     }
     signals.market_data_ready.emit(summary)
+    return summary
 
 
 __all__ = [
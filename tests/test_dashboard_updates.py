@@ -7,6 +7,7 @@ from datetime import datetime
 import pytest
 try:
     from PySide6.QtWidgets import QApplication
+    from PySide6.QtTest import QTest
 except Exception:  # pragma: no cover
     pytest.skip("PySide6 not available", allow_module_level=True)
 
@@ -18,6 +19,7 @@ from utils.timefmt import now_utc_iso
 def test_dashboard_updates():
     app = QApplication.instance() or QApplication([])
     w = DashboardWidget()
+    w.show()
     assert w.lblLastUpdate.text() == "Loading…"
 
     updates: list[dict] = []
@@ -41,7 +43,7 @@ def test_dashboard_updates():
         ],
     }
     signals.market_data_ready.emit(summary)
-    app.processEvents()
+    QTest.qWait(200)
 
     assert len(updates) == 1
     assert w.lblRecords.text() == "5"
@@ -62,3 +64,76 @@ def test_dashboard_updates():
     app.processEvents()
 
     assert len(updates) == 1
+
+
+def test_dashboard_defers_updates_while_hidden():
+    app = QApplication.instance() or QApplication([])
+    w = DashboardWidget()
+    w.on_market_data_ready({"last_update_utc": now_utc_iso(), "records": 7, "top_opportunities": []})
+    assert w.lblRecords.text() == "0"
+
+    w.show()
+    app.processEvents()
+    assert w.lblRecords.text() == "7"
+    assert w.topTable.item(0, 0).text() == "No opportunities"
+
+
+def test_dashboard_updates_unchanged_rows_in_place():
+    app = QApplication.instance() or QApplication([])
+    w = DashboardWidget()
+    w.show()
+    top = {
+        "item": "T4_BAG",
+        "buy_city": "Lymhurst",
+        "buy_price": 100,
+        "sell_city": "Martlock",
+        "sell_price": 150,
+        "spread": 50,
+        "roi_pct": 50.0,
+        "updated_dt": datetime.utcnow(),
+    }
+    w.on_market_data_ready({"records": 1, "top_opportunities": [top]})
+    QTest.qWait(200)
+    cell = w.topTable.item(0, 3)
+
+    w.on_market_data_ready({"records": 1, "top_opportunities": [dict(top, sell_price=160)]})
+    QTest.qWait(200)
+    assert w.topTable.item(0, 3) is cell
+    assert cell.text() == "160"
+
+    w.on_market_data_ready({"records": 1, "top_opportunities": [dict(top, item="T5_BAG")]})
+    QTest.qWait(200)
+    assert w.topTable.item(0, 0).text() == "T5_BAG"
+    assert w.topTable.item(0, 3) is cell
+
+
+def test_dashboard_coalesces_bursts():
+    app = QApplication.instance() or QApplication([])
+    w = DashboardWidget()
+    w.show()
+    for n in range(1, 6):
+        w.on_market_data_ready({"records": n, "top_opportunities": []})
+    assert w.lblRecords.text() == "0"
+    QTest.qWait(200)
+    assert w.lblRecords.text() == "5"
+
+
+def test_dashboard_catches_up_after_hide():
+    from services.market_prices import STORE
+
+    app = QApplication.instance() or QApplication([])
+    w = DashboardWidget()
+    w.show()
+    w.on_market_data_ready({"records": 7, "top_opportunities": []})
+    QTest.qWait(200)
+    assert w.lblRecords.text() == "7"
+
+    w.hide()
+    STORE.on_fetch_completed([])
+    app.processEvents()
+    assert w.lblRecords.text() == "7"
+
+    w.show()
+    app.processEvents()
+    assert w.lblRecords.text() == "0"
+    STORE.clear()
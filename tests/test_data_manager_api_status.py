@@ -6,12 +6,18 @@ sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 import pytest
 try:
     from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import QThreadPool, Qt
 except Exception:  # pragma: no cover
     pytest.skip("PySide6 not available", allow_module_level=True)
 
 import core.health as health
 from core.health import store
-from gui.widgets.data_manager import DataManagerWidget
+from gui.widgets.data_manager import DataManagerWidget, SourcesModel
+
+
+def _wait_probe(app):
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
 
 
 class DummyMain:
@@ -37,8 +43,10 @@ def test_api_status_tile(monkeypatch):
 
     monkeypatch.setattr(health, "ping_aodp", online_ping)
     w = DataManagerWidget(DummyMain())
-    assert w.api_status_card.value_label.text() == "🟢 Online"
-    assert w.api_status_card.subtitle_label.text() == "AODP Connection"
+    w.show()
+    _wait_probe(app)
+    assert w.api_status_value.text() == "🟢 Online"
+    assert w.api_status_sub.text() == "AODP Connection"
 
     def offline_ping(server):
         store.set_online(False)
@@ -46,5 +54,83 @@ def test_api_status_tile(monkeypatch):
 
     monkeypatch.setattr(health, "ping_aodp", offline_ping)
     w.refreshApiStatus()
-    assert w.api_status_card.value_label.text() == "🔴 Offline"
-    assert w.api_status_card.subtitle_label.text() == "Check network / rate limits"
+    _wait_probe(app)
+    assert w.api_status_value.text() == "🔴 Offline"
+    assert w.api_status_sub.text() == "Check network / rate limits"
+
+
+def test_database_stats_cached_until_invalidated(monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(health, "ping_aodp", lambda server: True)
+
+    class CountingDb:
+        calls = 0
+
+        def get_database_stats(self):
+            CountingDb.calls += 1
+            return {"total_records": 1234}
+
+    db = CountingDb()
+
+    class Main(DummyMain):
+        def get_db_manager(self):
+            return db
+
+    w = DataManagerWidget(Main())
+    assert CountingDb.calls == 0  # nothing is queried until the tab is shown
+    w.show()
+    _wait_probe(app)
+    w.update_status()
+    _wait_probe(app)
+    assert CountingDb.calls == 1
+    assert w.cache_value.text() == "1,234"
+
+    assert w.freshness_value.text() == "Never"
+
+    w.refresh_market_data()
+    w.update_status()
+    _wait_probe(app)
+    assert CountingDb.calls == 2
+    assert w.freshness_value.text() == "0.0h"
+
+
+def test_sources_model_signals_only_changed_cells():
+    app = QApplication.instance() or QApplication([])
+    model = SourcesModel()
+    resets = []
+    changed = []
+    model.modelReset.connect(lambda: resets.append(1))
+    model.dataChanged.connect(
+        lambda tl, br, roles: changed.append((tl.row(), tl.column(), br.row(), br.column()))
+    )
+
+    model.setRows([["AODP API", "🔴 Offline", "Never", "Real-time"]])
+    assert len(resets) == 1
+    model.setRows([["AODP API", "🟢 Online", "Never", "Real-time"]])
+    model.setRows([["AODP API", "🟢 Online", "Never", "Real-time"]])
+    assert len(resets) == 1
+    assert changed == [(0, 1, 0, 1)]
+    assert model.data(model.index(0, 1)) == "🟢 Online"
+
+    model.setRows([["AODP API", "🔴 Offline", "12:00:00", "Real-time"]])
+    assert changed[1:] == [(0, 1, 0, 2)]
+    assert model.headerData(3, Qt.Horizontal) == "Records"
+
+
+def test_health_bursts_redraw_once(monkeypatch):
+    from PySide6.QtTest import QTest
+
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(health, "ping_aodp", lambda server: True)
+    w = DataManagerWidget(DummyMain())
+    w.show()
+    _wait_probe(app)
+
+    redraws = []
+    monkeypatch.setattr(w, "on_health_changed", lambda s: redraws.append(s))
+    for online in (False, True, False, True):
+        store.set_online(online)
+    app.processEvents()
+    assert redraws == []
+    QTest.qWait(300)
+    assert len(redraws) == 1
@@ -0,0 +1,146 @@
+from engine.flips import FlipCalculator, FlipOpportunity
+
+
+def _opp(item_id, quality, profit, src="Martlock", dst="Lymhurst", risk="low"):
+    return FlipOpportunity(
+        item_id=item_id,
+        quality=quality,
+        src_city=src,
+        dst_city=dst,
+        strategy="fast",
+        profit_per_unit=profit,
+        suggested_qty=1,
+        expected_profit=profit,
+        risk=risk,
+        buy_price=100.0,
+        sell_price=100.0 + profit,
+        buy_fees=0.0,
+        sell_fees=0.0,
+        last_update_age_hours=1.0,
+    )
+
+
+def test_best_opportunities_by_item():
+    calc = FlipCalculator({})
+    opps = [
+        _opp("T4_SWORD", 1, 10.0),
+        _opp("T4_SWORD", 1, 30.0, dst="Thetford"),
+        _opp("T4_SWORD", 2, 5.0),
+        _opp("T4_BAG", 1, 7.0),
+        _opp("T4_BAG", 1, 7.0, dst="Thetford"),
+    ]
+    best = calc.get_best_opportunities_by_item(opps)
+    assert set(best) == {"T4_SWORD_q1", "T4_SWORD_q2", "T4_BAG_q1"}
+    assert best["T4_SWORD_q1"].dst_city == "Thetford"
+    assert best["T4_SWORD_q2"].profit_per_unit == 5.0
+    # ties keep the first opportunity seen
+    assert best["T4_BAG_q1"].dst_city == "Lymhurst"
+    assert calc.get_best_opportunities_by_item([]) == {}
+
+
+def test_age_hours_accepts_naive_aware_and_iso():
+    from datetime import datetime, timedelta, timezone
+
+    calc = FlipCalculator({})
+    aware = datetime.now(timezone.utc) - timedelta(hours=2)
+    naive = aware.replace(tzinfo=None)
+    iso = aware.isoformat().replace("+00:00", "Z")
+    for value in (aware, naive, iso):
+        assert abs(calc._calculate_age_hours(value) - 2.0) < 0.01
+
+
+def test_filter_and_portfolio_accept_batches():
+    from engine.flips import OpportunityBatch
+
+    calc = FlipCalculator({})
+    opps = [
+        _opp("T4_SWORD", 1, 10.0),
+        _opp("T4_SWORD", 1, 30.0, dst="Caerleon"),
+        _opp("T4_BAG", 1, 20.0),
+    ]
+    batch = OpportunityBatch.from_opportunities(opps)
+    assert len(batch) == 3
+    assert batch.to_list() == opps
+
+    assert calc.filter_opportunities(batch, min_profit=15) == opps[1:]
+    assert calc.filter_opportunities(opps, cities_filter=["Martlock", "Lymhurst"]) == [opps[0], opps[2]]
+
+    portfolio = calc.calculate_portfolio_profit(batch, capital_limit=200)
+    assert portfolio["selected_opportunities"] == [opps[1], opps[2]]
+    assert portfolio["total_investment"] == 200
+    assert portfolio["total_profit"] == 50.0
+
+    everything = calc.calculate_portfolio_profit(opps)
+    assert everything["num_opportunities"] == 3
+    assert calc.calculate_portfolio_profit([], capital_limit=10)["num_opportunities"] == 0
+
+
+def _price(city, sell, buy, quality=1):
+    from datetime import datetime, timezone
+
+    return {
+        "city": city,
+        "quality": quality,
+        "sell_price_min": sell,
+        "buy_price_max": buy,
+        "observed_at_utc": datetime.now(timezone.utc),
+    }
+
+
+def test_process_pool_matches_serial():
+    prices = {
+        f"T{t}_SWORD": [
+            _price("Martlock", 1000 + t, 950),
+            _price("Lymhurst", 1100, 1050 + t),
+            _price("Caerleon", 1300, 1200),
+        ]
+        for t in range(4, 9)
+    }
+    serial = FlipCalculator({}).calculate_flip_opportunities(prices)
+    pooled_calc = FlipCalculator({"flips": {"workers": 2, "parallel_min_items": 1}})
+    assert pooled_calc._use_process_pool(len(prices))
+    pooled = pooled_calc.calculate_flip_opportunities(prices)
+    key = lambda o: (o.item_id, o.quality, o.src_city, o.dst_city, o.strategy, round(o.profit_per_unit, 6))
+    assert [key(o) for o in pooled] == [key(o) for o in serial]
+
+
+def test_quality_flips_match_fee_calculator():
+    calc = FlipCalculator({})
+    quality_prices = {
+        p["city"]: p
+        for p in (
+            _price("Martlock", 1000, 900),
+            _price("Lymhurst", 1400, 1250),
+            _price("Caerleon", 1600, 0),
+        )
+    }
+    opps = calc._calculate_quality_flips("T4_SWORD", 1, quality_prices)
+    assert opps
+    for opp in opps:
+        expected = calc.fee_calculator.calculate_flip_profit(
+            quality_prices[opp.src_city], quality_prices[opp.dst_city], opp.strategy
+        )
+        assert opp.profit_per_unit == expected["profit_per_unit"]
+        assert opp.buy_fees == expected["buy_fees"]
+        assert opp.sell_fees == expected["sell_fees"]
+    # no buy orders in Caerleon, so nothing can be bought there with the patient strategy
+    assert not any(o.src_city == "Caerleon" and o.strategy == "patient" for o in opps)
+
+
+def test_max_risk_filter_uses_rank():
+    calc = FlipCalculator({})
+    low = _opp("T4_SWORD", 1, 10.0)
+    high = _opp("T4_SWORD", 1, 20.0, dst="Caerleon", risk="high")
+    assert (low.risk_rank, high.risk_rank) == (0, 2)
+    assert calc.filter_opportunities([low, high], max_risk="low") == [low]
+    assert calc.filter_opportunities([low, high], max_risk="medium") == [low]
+    assert calc.filter_opportunities([low, high], max_risk="high") == [low, high]
+
+
+def test_opportunity_is_slotted_and_picklable():
+    import pickle
+
+    opp = _opp("T4_SWORD", 1, 10.0, risk="high")
+    assert not hasattr(opp, "__dict__")
+    clone = pickle.loads(pickle.dumps(opp))
+    assert clone == opp and clone.risk_rank == 2
@@ -32,3 +32,255 @@ def test_detail_panel_uses_item_name(monkeypatch):
     widget.on_selection_changed()
     text = widget.details_text.toPlainText()
     assert "Sword" in text
+
+
+def _cell(widget, row, col, role=None):
+    index = widget.results_model.index(row, col)
+    return index.data() if role is None else index.data(role)
+
+
+def _column(widget, col):
+    return [_cell(widget, r, col) for r in range(widget.results_model.rowCount())]
+
+
+def test_results_table_sorted_by_roi_after_fill(monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(flip_finder, "fetch_icon_bytes", lambda *a, **k: None)
+    widget = FlipFinderWidget(None)
+    base = {"buy_city": "Martlock", "sell_city": "Lymhurst", "buy": 100, "updated": "1m"}
+    flips = [
+        dict(base, item_id=f"T{t}_BAG", sell=100 + t, spread=t, roi=t / 100, roi_pct=float(t))
+        for t in (4, 6, 5)
+    ]
+    widget.populate_results_table(flips)
+    assert isinstance(widget.results_table.model(), flip_finder.FlipsTableModel)
+    assert widget.results_table.isSortingEnabled()
+    assert _column(widget, 0) == ["T6_BAG", "T5_BAG", "T4_BAG"]
+
+    widget.populate_results_table(flips[:1])
+    assert widget.results_model.rowCount() == 1
+
+
+def test_updated_column_from_timestamps(monkeypatch):
+    from datetime import datetime, timedelta, timezone
+    import pandas as pd
+
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(flip_finder, "fetch_icon_bytes", lambda *a, **k: None)
+    widget = FlipFinderWidget(None)
+    ts = datetime.now(timezone.utc) - timedelta(minutes=5)
+    base = {"buy_city": "Martlock", "sell_city": "Lymhurst", "buy": 100, "sell": 150,
+            "spread": 50, "roi": 0.5, "roi_pct": 50.0}
+    flips = [
+        dict(base, item_id="T4_BAG", updated_dt=ts),
+        dict(base, item_id="T5_BAG", updated_dt=pd.Timestamp(ts)),
+        dict(base, item_id="T6_BAG", updated_dt=ts, updated="custom"),
+    ]
+    widget.populate_results_table(flips)
+    cells = {_cell(widget, r, 0): r for r in range(3)}
+    assert _cell(widget, cells["T4_BAG"], 6) == _cell(widget, cells["T5_BAG"], 6) == "5m"
+    assert _cell(widget, cells["T6_BAG"], 6) == "custom"
+    assert _cell(widget, cells["T4_BAG"], 6, flip_finder.Qt.UserRole) == int(ts.timestamp())
+
+
+def test_updated_column_sorts_by_timestamp(monkeypatch):
+    from datetime import datetime, timedelta, timezone
+
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(flip_finder, "fetch_icon_bytes", lambda *a, **k: None)
+    widget = FlipFinderWidget(None)
+    now = datetime.now(timezone.utc)
+    base = {"buy_city": "Martlock", "sell_city": "Lymhurst", "buy": 100, "sell": 150,
+            "spread": 50, "roi": 0.5, "roi_pct": 50.0}
+    # As text "10m" < "50s" < "9m"; by timestamp (oldest first) it is 10m, 9m, 50s
+    flips = [
+        dict(base, item_id=name, updated_dt=now - delta)
+        for name, delta in (("A", timedelta(seconds=50)), ("B", timedelta(minutes=9)), ("C", timedelta(minutes=10)))
+    ]
+    widget.populate_results_table(flips + [dict(base, item_id="D")])
+    widget.results_table.sortByColumn(6, flip_finder.Qt.AscendingOrder)
+    assert _column(widget, 6) == ["10m", "9m", "50s", ""]
+    widget.results_table.sortByColumn(6, flip_finder.Qt.DescendingOrder)
+    assert _column(widget, 6) == ["50s", "9m", "10m", ""]
+    widget.results_table.sortByColumn(1, flip_finder.Qt.AscendingOrder)
+    assert _column(widget, 0) == ["A", "B", "C", "D"]
+
+
+def test_sort_keeps_selection_on_the_same_flip(monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(flip_finder, "fetch_icon_bytes", lambda *a, **k: None)
+    widget = FlipFinderWidget(None)
+    base = {"buy_city": "Martlock", "sell_city": "Lymhurst", "buy": 100, "sell": 150, "spread": 50, "roi": 0.5}
+    widget.populate_results_table([dict(base, item_id=f"T{i}_BAG", roi_pct=float(i)) for i in (4, 5, 6)])
+    widget.results_table.selectRow(2)
+    assert "T4_BAG" in widget.details_text.toPlainText()
+    widget.results_table.sortByColumn(5, flip_finder.Qt.AscendingOrder)
+    rows = widget.results_table.selectionModel().selectedRows()
+    assert [i.row() for i in rows] == [0] and _cell(widget, 0, 0) == "T4_BAG"
+
+
+def test_partial_chunks_fill_table_incrementally(monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(flip_finder, "fetch_icon_bytes", lambda *a, **k: None)
+    widget = FlipFinderWidget(None)
+    base = {"buy_city": "Martlock", "sell_city": "Lymhurst", "buy": 100, "sell": 150, "spread": 50, "roi": 0.5}
+    flips = [dict(base, item_id=f"T{i}_BAG", roi_pct=float(i)) for i in range(4, 9)]
+    widget.populate_results_table(flips[:1])  # stale rows from a previous search
+    widget._streamed_rows = 0
+    widget.on_partial_flips(flips[:2])
+    assert _column(widget, 0) == ["T4_BAG", "T5_BAG"]
+    widget.on_partial_flips(flips[2:])
+    assert widget.results_model.rowCount() == 5
+    widget.on_flips_found({"flips": flips})
+    assert _column(widget, 0) == [f"T{i}_BAG" for i in range(8, 3, -1)]
+
+
+def test_search_parameters_read_quality_from_item_data():
+    app = QApplication.instance() or QApplication([])
+    widget = FlipFinderWidget(None)
+    widget.quality_combo.setCurrentText("Excellent (4)")
+    widget.items_edit.setText("t4_bag, T5_BAG")
+    params = widget.get_search_parameters()
+    assert params["items_raw"] == "t4_bag, T5_BAG" and "items" not in params
+    assert params["qualities"] == [4]
+    assert params["src_cities"] == params["dst_cities"] == params["cities"]
+    widget.quality_combo.setCurrentText("All")
+    assert widget.get_search_parameters()["qualities"] == [1, 2, 3, 4, 5]
+
+
+def test_identical_results_keep_existing_rows(monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(flip_finder, "fetch_icon_bytes", lambda *a, **k: None)
+    flips = [{"item_id": "T4_BAG", "quality": 1, "buy_city": "Martlock", "sell_city": "Lymhurst",
+              "buy": 100, "sell": 150, "spread": 50, "roi": 0.5, "roi_pct": 50.0}]
+    monkeypatch.setattr(flip_finder.STORE, "latest_rows", lambda: [])
+    monkeypatch.setattr(flip_finder, "build_flips", lambda **k: ([dict(f) for f in flips], {}))
+    widget = FlipFinderWidget(None)
+    resets = []
+    widget.results_model.modelReset.connect(lambda: resets.append(1))
+
+    def search():
+        params = widget.get_search_parameters()
+        params["previous_signature"] = widget._results_signature
+        worker = flip_finder.FlipFinderWorker(params)
+        streamed = []
+        worker.partial.connect(streamed.append)
+        worker.partial.connect(widget.on_partial_flips)
+        worker.finished.connect(widget.on_flips_found)
+        worker.run()
+        return streamed
+
+    assert search()
+    first = widget.results_model.flip(0)
+    resets.clear()
+    assert search() == []
+    assert widget.results_model.flip(0) is first and not resets
+    flips[0]["sell"] = 160
+    assert search()
+    assert _cell(widget, 0, 3) == 160
+
+
+def test_same_row_count_updates_in_place(monkeypatch):
+    from datetime import datetime, timedelta, timezone
+
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(flip_finder, "fetch_icon_bytes", lambda *a, **k: None)
+    widget = FlipFinderWidget(None)
+    now = datetime.now(timezone.utc)
+    base = {"buy_city": "Martlock", "sell_city": "Lymhurst", "buy": 100, "spread": 50, "roi": 0.5}
+    widget.populate_results_table([
+        dict(base, item_id="A", sell=150, roi_pct=10.0, updated_dt=now - timedelta(minutes=3)),
+        dict(base, item_id="B", sell=150, roi_pct=20.0),
+    ])
+    model = widget.results_model
+    resets, changes = [], []
+    model.modelReset.connect(lambda: resets.append(1))
+    model.dataChanged.connect(lambda a, b, roles=(): changes.append((a.row(), a.column(), b.row(), b.column())))
+    widget.populate_results_table([
+        dict(base, item_id="C", sell=170, roi_pct=5.0),
+        dict(base, item_id="D", sell=180, roi_pct=30.0, updated_dt=now - timedelta(minutes=7)),
+    ])
+    assert not resets and changes == [(0, 0, 1, 6)]
+    assert _column(widget, 0) == ["D", "C"]
+    assert _cell(widget, 0, 3) == 180
+    assert _cell(widget, 0, 6) == "7m" and _cell(widget, 1, 6, flip_finder.Qt.UserRole) is None
+    assert _cell(widget, 1, 0, flip_finder.Qt.UserRole)["item_id"] == "C"
+
+
+def test_numeric_cells_hold_raw_values(monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(flip_finder, "fetch_icon_bytes", lambda *a, **k: None)
+    widget = FlipFinderWidget(None)
+    widget.populate_results_table([{"item_id": "T4_BAG", "buy_city": "Martlock", "sell_city": "Lymhurst",
+                                    "buy": 1000, "sell": 1500, "spread": 500, "roi": 0.5, "roi_pct": 50.5}])
+    assert [_cell(widget, 0, c, flip_finder.Qt.EditRole) for c in range(2, 6)] == [1000, 1500, 500, 50.5]
+    assert _cell(widget, 0, 1) == "Martlock → Lymhurst"
+
+
+def _png_bytes():
+    from PySide6.QtCore import QBuffer, QByteArray, QIODevice
+    from PySide6.QtGui import QPixmap
+
+    pm = QPixmap(4, 4)
+    pm.fill()
+    ba = QByteArray()
+    buf = QBuffer(ba)
+    buf.open(QIODevice.WriteOnly)
+    pm.save(buf, "PNG")
+    return bytes(ba)
+
+
+def test_icons_are_fetched_in_background_once(monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    calls = []
+    png = _png_bytes()
+
+    def fake_fetch(item_id, quality):
+        calls.append((item_id, quality))
+        return png
+
+    monkeypatch.setattr(flip_finder, "fetch_icon_bytes", fake_fetch)
+    widget = FlipFinderWidget(None)
+    base = {"buy_city": "Martlock", "sell_city": "Lymhurst", "buy": 100, "sell": 150,
+            "spread": 50, "roi": 0.5, "roi_pct": 50.0, "quality": 1}
+    flips = [dict(base, item_id="T4_BAG"), dict(base, item_id="T4_BAG", sell_city="Thetford")]
+    widget.populate_results_table(flips)
+    decoration = flip_finder.Qt.DecorationRole
+    assert _cell(widget, 0, 0, decoration) is None
+    repainted = []
+    widget.results_model.dataChanged.connect(lambda a, b, roles=(): repainted.append((a.row(), b.row())))
+    widget._icon_pool.waitForDone()
+    app.processEvents()
+    assert repainted == [(0, 1)]
+    assert not _cell(widget, 0, 0, decoration).isNull() and not _cell(widget, 1, 0, decoration).isNull()
+    assert calls == [("T4_BAG", 1)]
+    widget.populate_results_table(flips[:1])
+    assert not _cell(widget, 0, 0, decoration).isNull()
+    assert calls == [("T4_BAG", 1)]
+
+
+def test_search_requests_are_debounced(monkeypatch):
+    from PySide6.QtCore import QThreadPool
+    from PySide6.QtTest import QTest
+
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(flip_finder, "fetch_icon_bytes", lambda *a, **k: None)
+    monkeypatch.setattr(flip_finder.STORE, "latest_rows", lambda: [])
+    runs = []
+    flip = {"item_id": "T4_BAG", "buy_city": "Martlock", "sell_city": "Lymhurst",
+            "buy": 100, "sell": 150, "spread": 50, "roi": 0.5, "roi_pct": 50.0}
+
+    def fake_build_flips(**kwargs):
+        runs.append(1)
+        return [dict(flip)], {}
+
+    monkeypatch.setattr(flip_finder, "build_flips", fake_build_flips)
+    widget = FlipFinderWidget(None)
+    for _ in range(3):
+        widget.search_opportunities()
+    assert widget._search_debounce.isActive() and not runs
+    QTest.qWait(300)
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+    assert runs == [1]
+    assert widget.results_model.rowCount() == 1 and not widget._search_running
@@ -60,3 +60,62 @@ def test_zero_relaxed_fallback():
     strict_stats = all_stats[0][1]
     assert strict_stats.get("no_buy", 0) > 0 or strict_stats.get("stale", 0) > 0
 
+
+
+def test_top_results_match_full_sort():
+    now_h = time.time() / 3600.0
+    cities = ["Martlock", "Lymhurst", "Thetford", "Bridgewatch"]
+    rows = [
+        {
+            "item_id": f"T{t}_BAG",
+            "city": city,
+            "quality": 1,
+            "buy_price_max": 100 + 37 * i + t,
+            "sell_price_min": 100 + 37 * i + t,
+            "updated_epoch_hours": now_h - 1,
+        }
+        for t in range(4, 9)
+        for i, city in enumerate(cities)
+    ]
+    kwargs = dict(
+        rows=rows, items_filter=None, src_cities=set(cities), dst_cities=set(cities),
+        qualities=[1], min_profit=1, min_roi=0.0, max_age_hours=24,
+    )
+    everything, _ = build_flips(max_results=1000, **kwargs)
+    top, stats = build_flips(max_results=5, **kwargs)
+    assert len(everything) > 5 and stats["kept"] == len(everything)
+    assert top == everything[:5]
+
+
+def test_prefilter_matches_build_flips_filters():
+    from services.flip_engine import prefilter_rows, price_columns
+
+    now_h = time.time() / 3600.0
+    rows = [
+        {"item_id": "T4_BAG", "city": "Martlock", "quality": 1, "buy_price_max": 100, "sell_price_min": 0, "updated_epoch_hours": now_h - 1},
+        {"item_id": "T4_BAG", "city": "Lymhurst", "quality": 1, "buy_price_max": 0, "sell_price_min": 180, "updated_epoch_hours": now_h - 2},
+        {"item_id": "T4_BAG", "city": "Lymhurst", "quality": 2, "buy_price_max": 0, "sell_price_min": 150, "updated_epoch_hours": now_h - 2},
+        {"item_id": "T4_BAG", "city": "Thetford", "quality": 1, "buy_price_max": 0, "sell_price_min": 300, "updated_epoch_hours": now_h - 1},
+        {"item_id": "T5_BAG", "city": "Martlock", "quality": 1, "buy_price_max": 100, "sell_price_min": 0, "updated_epoch_hours": now_h - 1},
+        {"item_id": "T4_BAG", "city": "Martlock", "quality": 1, "buy_price_max": 120, "sell_price_min": 0, "updated_epoch_hours": now_h - 50},
+        {"item_id": None, "city": None, "quality": None, "buy_price_max": 0, "sell_price_min": 0},
+    ]
+    columns = price_columns(rows)
+    for items, max_age in (({"T4_BAG"}, 24), (None, 24), (None, 0), (set(), 100)):
+        kwargs = dict(items_filter=items, src_cities={"Martlock"}, dst_cities={"Lymhurst"}, qualities=[1], max_age_hours=max_age)
+        direct = build_flips(rows=rows, min_profit=1, min_roi=0.0, max_results=10, **kwargs)
+        kept, dropped = prefilter_rows(rows, columns, **kwargs)
+        flips, stats = build_flips(rows=kept, min_profit=1, min_roi=0.0, max_results=10, **kwargs)
+        stats.update(dropped)
+        assert flips == direct[0]
+        assert stats == direct[1]
+
+
+def test_price_columns_use_narrow_dtypes():
+    import numpy as np
+    from services.flip_engine import price_columns
+
+    cols = price_columns([{"item_id": "T4_BAG", "city": "Martlock", "quality": 3, "updated_epoch_hours": 1.5}, {}])
+    assert cols["item_codes"].dtype == np.int32 and cols["city_codes"].dtype == np.int16
+    assert cols["quality"].dtype == np.int16 and cols["quality"].tolist() == [3, 1]
+    assert cols["updated"].dtype == np.float64 and cols["item_codes"].tolist() == [0, -1]
@@ -52,3 +52,54 @@ def test_trimmed_rows_and_roi_conversion(monkeypatch):
     rows = captured["rows"]
     assert rows and rows[0]["buy"] == 100 and rows[0]["sell"] == 200
     assert captured["min_roi"] == 0.05
+
+
+def test_worker_parses_raw_item_text(monkeypatch):
+    STORE.clear()
+    STORE._latest_rows = [{"item_id": "T4_BAG", "city": "Martlock", "quality": 1, "buy_price_max": 10, "sell_price_min": 20}]
+    seen = []
+
+    def fake_build_flips(*, items_filter, **kwargs):
+        seen.append(items_filter)
+        return [], {}
+
+    monkeypatch.setattr(flip_finder, "build_flips", fake_build_flips)
+    worker = FlipFinderWorker({"items_raw": "t4_bag, T5_BAG ,", "cities": ["Martlock"]})
+    done = []
+    worker.finished.connect(done.append)
+    worker.run()
+    assert done and seen[0] == {"T4_BAG", "T5_BAG"}
+
+
+def test_normalize_price_rows_coalesces_aliases():
+    rows = [
+        {"item_id": "A", "buy_price_max": 100, "sell_price_min": None},
+        {"item_id": "B", "buy_max": "50", "sell_min": 7, "SellMin": 9},
+        {"item_id": "C", "BuyMax": 0, "sell_price_min": 0},
+        {"item_id": "D", "buy_price_max": "bad", "buy_max": 3.5},
+        {"item_id": "E"},
+    ]
+    trimmed = flip_finder._normalize_price_rows(rows)
+    assert [(r["item_id"], r["buy"], r["sell"]) for r in trimmed] == [("A", 100.0, 0.0), ("B", 50.0, 7.0), ("D", 3.5, 0.0)]
+    assert trimmed[1]["buy_price_max"] == 50.0 and trimmed[1]["sell_price_min"] == 7.0
+    assert "buy" not in rows[0]
+    assert flip_finder._normalize_price_rows([]) == []
+
+
+def test_worker_skips_tiers_repeating_an_earlier_spec(monkeypatch):
+    STORE.clear()
+    STORE._latest_rows = [{"item_id": "T4_BAG", "city": "Martlock", "quality": 1, "buy_price_max": 10, "sell_price_min": 20}]
+    tags = []
+
+    def fake_build_flips(*, min_roi, max_age_hours, items_filter, **kwargs):
+        tags.append((items_filter, min_roi, max_age_hours))
+        return [], {"seen_rows": 1}
+
+    monkeypatch.setattr(flip_finder, "build_flips", fake_build_flips)
+    worker = FlipFinderWorker({"cities": ["Martlock"], "min_profit": 5, "min_roi": 20.0, "max_age_hours": 24})
+    done = []
+    worker.finished.connect(done.append)
+    worker.run()
+    # relaxed-2 repeats relaxed-1 when no items were typed
+    assert tags == [(None, 0.2, 24), (None, 0.1, 168), (None, 0.01, 336)]
+    assert [t for t, _, _ in done[0]["all_stats"]] == ["strict", "relaxed-1", "relaxed-2", "relaxed-3"]
@@ -34,3 +34,43 @@ def test_fetch_icon_bytes_uses_shared_session_and_cache(monkeypatch):
     data2 = item_icons.fetch_icon_bytes("item", 1)
     assert data2 == b"data"
     assert session.calls == 1
+
+
+def test_widget_icon_cache_revalidates_with_etag(monkeypatch, tmp_path):
+    import os
+    import pytest
+
+    pytest.importorskip("PySide6.QtGui")
+    from gui.widgets import icons
+
+    calls = []
+
+    class Resp:
+        def __init__(self, status, content=b"", etag=None):
+            self.status_code = status
+            self.content = content
+            self.headers = {"ETag": etag} if etag else {}
+
+    replies = [Resp(200, b"png", '"v1"'), Resp(304)]
+
+    class Session:
+        def get(self, url, timeout, headers):
+            calls.append(dict(headers))
+            return replies.pop(0)
+
+    monkeypatch.setattr(icons, "_cache_dir", lambda: tmp_path)
+    monkeypatch.setattr(icons, "get_shared_session", Session)
+    icons._get_icon_cached.cache_clear()
+
+    icons.get_icon({"item_id": "T4_BAG", "quality": 2})
+    icons.get_icon({"item_id": "T4_BAG", "quality": "2"})
+    assert calls == [{}]
+    assert (tmp_path / "T4_BAG_2.etag").read_text() == '"v1"'
+
+    png = tmp_path / "T4_BAG_2.png"
+    os.utime(png, (0, 0))
+    icons._get_icon_cached.cache_clear()
+    icons.get_icon({"item_id": "T4_BAG", "quality": 2})
+    assert calls[1] == {"If-None-Match": '"v1"'}
+    assert png.read_bytes() == b"png" and png.stat().st_mtime > 0
+    icons._get_icon_cached.cache_clear()
@@ -0,0 +1,39 @@
+import os, sys, pathlib
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("QT_OPENGL", "software")
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+import pytest
+try:
+    from PySide6.QtWidgets import QApplication
+except Exception:  # pragma: no cover
+    pytest.skip("PySide6 not available", allow_module_level=True)
+
+from gui.widgets.items_browser import ItemsBrowser
+
+
+def _row(item_id, city, quality):
+    return {"item_id": item_id, "city": city, "quality": quality}
+
+
+def test_filters_combine_text_city_and_quality():
+    app = QApplication.instance() or QApplication([])
+    b = ItemsBrowser()
+    rows = [
+        _row("T4_BAG", "Martlock", 1),
+        _row("T4_BAG", "Lymhurst", 2),
+        _row("T5_BAG", "Martlock", 2),
+        _row("T4_SWORD", "Martlock", 2),
+    ]
+    b.on_rows_updated(rows)
+    assert b.rows_filtered is rows
+
+    b.search.setText("bag")
+    assert b.rows_filtered == rows[:3]
+    b.cboCity.setCurrentText("Martlock")
+    assert b.rows_filtered == [rows[0], rows[2]]
+    b.cboQual.setCurrentText("2")
+    assert b.rows_filtered == [rows[2]]
+
+    b.on_rows_updated([])
+    assert b.rows_filtered == []
@@ -29,6 +29,30 @@ def test_catalog_provider_downloads_and_caches(tmp_path, monkeypatch):
     assert (tmp_path / "items_master.json").exists()
 
 
+def test_read_master_catalog_reparses_only_after_rewrite(tmp_path, monkeypatch):
+    import os
+
+    path = tmp_path / "items_master.json"
+    path.write_text(json.dumps(["T4_BAG", "T5_BAG"]))
+    monkeypatch.setattr(cp, "CACHE_PATH", str(path))
+    monkeypatch.setattr(cp, "_read_memo", None)
+
+    loads = []
+    real_load = cp.json.load
+    monkeypatch.setattr(cp.json, "load", lambda f: loads.append(1) or real_load(f))
+
+    first = cp.read_master_catalog()
+    first.append("MUTATED")
+    assert cp.read_master_catalog() == ["T4_BAG", "T5_BAG"]
+    assert len(loads) == 1
+
+    path.write_text(json.dumps(["T6_BAG"]))
+    st = os.stat(path)
+    os.utime(path, (st.st_atime, st.st_mtime + 10))
+    assert cp.read_master_catalog() == ["T6_BAG"]
+    assert len(loads) == 2
+
+
 def test_fetch_prices_uses_catalog_when_empty_and_fetch_all_true(monkeypatch):
     catalog = ["A", "B", "C"]
     monkeypatch.setattr(mp, "items_catalog_codes", lambda: catalog)
@@ -3,7 +3,7 @@ import sys, pathlib
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 
-from utils.timefmt import to_utc, rel_age, fmt_tooltip, _to_dt
+from utils.timefmt import to_utc, rel_age, fmt_age, fmt_tooltip, _to_dt
 
 
 def test_to_utc_parses_strings():
@@ -16,6 +16,8 @@ def test_rel_age_formats():
     now = datetime.now(timezone.utc)
     assert rel_age(now - timedelta(seconds=59)) == "59s"
     assert rel_age(now - timedelta(minutes=2)) == "2m"
+    assert rel_age(now - timedelta(hours=3), now=now) == "3h"
+    assert [fmt_age(s) for s in (0, 59, 60, 3599, 3600)] == ["0s", "59s", "1m", "59m", "1h"]
 
 
 def test_rel_age_and_tooltip_accept_str():
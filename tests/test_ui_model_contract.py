@@ -5,7 +5,7 @@ sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 
 from datetime import datetime, timezone, timedelta
 
-from services.market_prices import normalize_and_dedupe
+from services.market_prices import normalize_and_dedupe, top_opportunities
 from utils.timefmt import rel_age
 
 
@@ -38,3 +38,28 @@ def test_rows_ready_for_ui():
     expected_roi = 100 * r["spread"] / max(1, r["buy_price_max"])
     assert abs(r["roi_pct"] - expected_roi) < 0.01
     assert r["updated_human"] == rel_age(r["updated_dt"])
+
+
+def test_top_opportunities_ranked_plain_dicts():
+    import pandas as pd
+
+    now = datetime.now(timezone.utc)
+    raw = [
+        {"item_id": item, "city": "Martlock", "quality": 1,
+         "sell_price_min": sell, "buy_price_max": 100,
+         "sell_price_min_date": now.isoformat()}
+        for item, sell in (("T4_BAG", 150), ("T5_BAG", 300), ("T6_BAG", 90))
+    ]
+    tops = top_opportunities(pd.DataFrame(normalize_and_dedupe(raw)), limit=5)
+    assert [t["item"] for t in tops] == ["T5_BAG", "T4_BAG"]
+    assert tops[0] == {
+        "item": "T5_BAG",
+        "buy_city": "Martlock",
+        "sell_city": "Martlock",
+        "buy_price": 100,
+        "sell_price": 300,
+        "spread": 200,
+        "roi_pct": 200.0,
+        "updated_dt": tops[0]["updated_dt"],
+    }
+    assert type(tops[0]["spread"]) is int
@@ -106,14 +106,29 @@ def ensure_master_catalog(cache_ttl_sec: int = CACHE_TTL_SEC) -> list[str]:
         return json.load(f)
 
 
+# (path, mtime, ids) of the last catalogue parsed by read_master_catalog
+_read_memo: tuple[str, float, tuple[str, ...]] | None = None
+
+
 def read_master_catalog() -> list[str]:
-    """Read the cached catalogue without refreshing it."""
+    """Read the cached catalogue without refreshing it.
+
+    The parsed list is memoised against the cache file's mtime, so repeated
+    "all items" fetches don't re-parse the JSON until the file is rewritten.
+    """
 
+    global _read_memo
     try:
+        mtime = os.stat(CACHE_PATH).st_mtime
+        memo = _read_memo
+        if memo is not None and memo[0] == CACHE_PATH and memo[1] == mtime:
+            return list(memo[2])
         with open(CACHE_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
+            ids = json.load(f)
     except FileNotFoundError:
         return ensure_master_catalog()
+    _read_memo = (CACHE_PATH, mtime, tuple(ids))
+    return ids
 
 
 __all__ = ["ensure_master_catalog", "read_master_catalog"]
@@ -9,4 +9,8 @@ MAX_DATA_AGE_HOURS = 4320  # 180 days
 # The endpoint also accepts enchantment suffixes and ``?quality=`` parameters.
 ICON_BASE = "https://render.albiononline.com/v1/item/{id}.png"
 
-__all__ = ["MAX_DATA_AGE_HOURS", "ICON_BASE"]
+# AODP answers price queries from a proxy cache; refetching sooner than this
+# returns the same data.
+AODP_CACHE_TTL_SECONDS = 300
+
+__all__ = ["MAX_DATA_AGE_HOURS", "ICON_BASE", "AODP_CACHE_TTL_SECONDS"]
@@ -63,12 +63,25 @@ def _to_dt(value: Any) -> Optional[datetime]:
     return None
 
 
-def rel_age(dt_like) -> str:
-    """Return a human friendly age for ``dt_like`` relative to now."""
+def rel_age(dt_like, now: Optional[datetime] = None) -> str:
+    """Return a human friendly age for ``dt_like`` relative to now.
+
+    ``now`` (UTC-aware) may be passed in when formatting many timestamps
+    against the same reference time.
+    """
+
+    if now is None:
+        now = datetime.now(timezone.utc)
+    dt = _to_dt(dt_like) or now
+    return fmt_age(int(now.timestamp() - dt.timestamp()))
+
+
+def fmt_age(secs: int) -> str:
+    """Return the :func:`rel_age` text for an age of ``secs`` seconds.
+
+    Lets callers that already hold epoch seconds skip datetime arithmetic.
+    """
 
-    dt = _to_dt(dt_like) or datetime.now(timezone.utc)
-    delta = datetime.now(timezone.utc) - dt
-    secs = int(delta.total_seconds())
     if secs < 60:
         return f"{secs}s"
     mins = secs // 60
@@ -90,4 +103,4 @@ def now_utc_iso() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-__all__ = ["to_utc", "rel_age", "fmt_tooltip", "now_utc_iso"]
+__all__ = ["to_utc", "rel_age", "fmt_age", "fmt_tooltip", "now_utc_iso"]